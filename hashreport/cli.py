@@ -14,6 +14,7 @@ import logging
 import os
 import subprocess  # nosec B404 - used for pip self-upgrade with fixed arguments
 import sys
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -263,10 +264,11 @@ def scan(
                 sys.exit(1)
             return
 
-        # Create output files with explicit formats
+        # Create output files with explicit formats, sharing one timestamp
+        timestamp = datetime.now().strftime(get_config().timestamp_format)
         output_files = [
             (
-                get_report_filename(output, output_format=fmt)
+                get_report_filename(output, output_format=fmt, timestamp=timestamp)
                 if not output.endswith(f".{fmt}")
                 else output
             )
@@ -1,6 +1,7 @@
 """Configuration management for hashreport."""
 
 import logging
+import os
 from dataclasses import MISSING, dataclass, field, fields
 from pathlib import Path
 from typing import Any, ClassVar, Dict, List, Optional
@@ -17,6 +18,17 @@ from hashreport.utils.type_defs import (
 logger = logging.getLogger(__name__)
 
 
+def available_cpu_count() -> int:
+    """Return the number of CPUs this process may run on.
+
+    Uses the scheduler affinity mask where the platform exposes it, so
+    containers and pinned processes are not sized by the host CPU count.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
 @dataclass
 class HashReportConfig:
     """Configuration settings for hashreport."""
@@ -37,7 +49,7 @@ class HashReportConfig:
     default_algorithm: str = "md5"
     default_format: str = "csv"
     supported_formats: List[str] = field(default_factory=lambda: ["csv", "json"])
-    chunk_size: int = 4096
+    chunk_size: int = 262144  # 256KB read buffer for hashing
     mmap_threshold: int = 10485760  # 10MB default threshold for mmap usage
     timestamp_format: str = "%y%m%d-%H%M"
     show_progress: bool = True
@@ -55,6 +67,7 @@ class HashReportConfig:
     progress_update_interval: float = 0.1  # seconds
     resource_check_interval: float = 1.0  # seconds
     memory_threshold: float = 0.85
+    walk_workers: int = 1  # threads listing directories; >1 helps network drives
 
     # Progress display settings
     progress: Dict[str, Any] = field(
@@ -87,9 +100,7 @@ class HashReportConfig:
         # Set max_workers if not specified
         if self.max_workers is None:
             try:
-                import os
-
-                self.max_workers = min(32, (os.cpu_count() or 4) * 2)
+                self.max_workers = min(32, available_cpu_count() * 2)
             except Exception:
                 self.max_workers = 8
 
@@ -143,6 +154,8 @@ class HashReportConfig:
             errors.append("batch_size must be positive")
         if self.min_workers <= 0:
             errors.append("min_workers must be positive")
+        if self.walk_workers <= 0:
+            errors.append("walk_workers must be positive")
 
         # Non-negative integer validations
         if self.max_retries < 0:
@@ -355,6 +368,7 @@ class HashReportConfig:
             "progress_update_interval": self.progress_update_interval,
             "resource_check_interval": self.resource_check_interval,
             "memory_threshold": self.memory_threshold,
+            "walk_workers": self.walk_workers,
             "progress": self.progress,
         }
 
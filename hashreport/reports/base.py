@@ -1,7 +1,8 @@
 """Base classes for report handlers."""
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any, Callable, ClassVar, Iterator
 
 from hashreport.utils.exceptions import ReportError
 from hashreport.utils.type_defs import (
@@ -76,6 +77,22 @@ class BaseReportHandler:
         """
         raise NotImplementedError("Subclasses must override 'append'.")
 
+    @contextmanager
+    def stream(self) -> Iterator[Callable[[ReportData], None]]:
+        """Open the report for writing entries in batches.
+
+        Yields a function that accepts a list of entries. The default
+        implementation collects every batch and calls :meth:`write` when the
+        block exits without error; handlers that can write incrementally
+        override this so memory does not grow with the number of entries.
+
+        Raises:
+            ReportError: If there's an error writing the report
+        """
+        entries: ReportData = []
+        yield entries.extend
+        self.write(entries)
+
     def validate_path(self) -> None:
         """Validate and prepare the report filepath.
 
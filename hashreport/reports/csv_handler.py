@@ -1,7 +1,8 @@
 """CSV report handler implementation."""
 
 import csv
-from typing import Any
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Iterator, Optional, Tuple
 
 from hashreport.reports.base import BaseReportHandler
 from hashreport.utils.exceptions import ReportError
@@ -42,6 +43,50 @@ class CSVReportHandler(BaseReportHandler):
         except OSError as e:
             raise ReportError(f"Error writing CSV report: {e}")
 
+    @contextmanager
+    def stream(self) -> Iterator[Callable[[ReportData], None]]:
+        """Write CSV rows batch by batch as they are produced.
+
+        The file is created with the first non-empty batch, matching
+        :meth:`write`, and removed again if the block raises. Batches whose
+        rows all have the header's keys in order are written as plain value
+        rows, skipping the per-row key checks of ``csv.DictWriter``.
+        """
+        f: Optional[IO[str]] = None
+        writer: Optional[csv.DictWriter] = None
+        row_writer: Any = None
+        fieldnames: Tuple[str, ...] = ()
+
+        def write_rows(data: ReportData) -> None:
+            nonlocal f, writer, row_writer, fieldnames
+            if not data:
+                return
+            try:
+                validated_data = validate_report_data(data)
+                if writer is None:
+                    self.validate_path()
+                    f = self.filepath.open("w", newline="", encoding="utf-8")
+                    fieldnames = tuple(validated_data[0])
+                    writer = csv.DictWriter(f, fieldnames=fieldnames)
+                    row_writer = csv.writer(f)
+                    writer.writeheader()
+                if all(tuple(row) == fieldnames for row in validated_data):
+                    row_writer.writerows(map(dict.values, validated_data))
+                else:
+                    writer.writerows(validated_data)
+            except OSError as e:
+                raise ReportError(f"Error writing CSV report: {e}")
+
+        try:
+            yield write_rows
+        except BaseException:
+            if f is not None:
+                f.close()
+                self.filepath.unlink(missing_ok=True)
+            raise
+        if f is not None:
+            f.close()
+
     def append(self, entry: ReportEntry) -> None:
         """Append a single entry to the CSV report.
 
@@ -10,12 +10,46 @@ Example:
 """  # noqa: E501
 
 import json
-from typing import Any
+from contextlib import contextmanager
+from json.encoder import encode_basestring_ascii
+from typing import IO, Any, Callable, Iterator, Optional
 
 from hashreport.reports.base import BaseReportHandler
 from hashreport.utils.exceptions import ReportError
 from hashreport.utils.type_defs import ReportData, ReportEntry, validate_report_data
 
+# Scanner column names and their JSON report equivalents
+_FIELD_RENAMES = {
+    "File Path": "file",
+    "File Name": "name",
+    "Hash Value": "hash",
+    "Hash Algorithm": "algorithm",
+    "Last Modified Date": "modified",
+    "Created Date": "created",
+    "Size": "size",
+}
+
+
+def _encode_entry(entry: ReportEntry) -> str:
+    """Encode one report entry as it appears inside an indented JSON array.
+
+    Flat entries with string keys are assembled directly from the C string
+    encoder, since ``json.dumps`` falls back to its pure-Python encoder
+    whenever ``indent`` is set. Anything else goes through ``json.dumps``.
+    """
+    parts = []
+    for key, value in entry.items():
+        if type(key) is not str or isinstance(value, (dict, list, tuple)):
+            return json.dumps([entry], indent=2)[2:-2]
+        if type(value) is str:
+            encoded = encode_basestring_ascii(value)
+        else:
+            encoded = json.dumps(value)
+        parts.append(f"    {encode_basestring_ascii(key)}: {encoded}")
+    if not parts:
+        return "  {}"
+    return "  {\n" + ",\n".join(parts) + "\n  }"
+
 
 class JSONReportError(ReportError):
     """Exception raised for JSON-specific report errors."""
@@ -51,6 +85,7 @@ class JSONReportHandler(BaseReportHandler):
         if isinstance(data, dict):
             data = [data]
 
+        converted = []
         for entry in data:
             if not isinstance(entry, dict):
                 raise JSONReportError("Each entry must be a dictionary")
@@ -61,23 +96,15 @@ class JSONReportHandler(BaseReportHandler):
                     "Each entry must have a 'file' or 'File Path' field"
                 )
 
-            # Convert old field names to new format
-            if "File Path" in entry:
-                entry["file"] = entry.pop("File Path")
-            if "File Name" in entry:
-                entry["name"] = entry.pop("File Name")
-            if "Hash Value" in entry:
-                entry["hash"] = entry.pop("Hash Value")
-            if "Hash Algorithm" in entry:
-                entry["algorithm"] = entry.pop("Hash Algorithm")
-            if "Last Modified Date" in entry:
-                entry["modified"] = entry.pop("Last Modified Date")
-            if "Created Date" in entry:
-                entry["created"] = entry.pop("Created Date")
-            if "Size" in entry:
-                entry["size"] = entry.pop("Size")
-
-        return validate_report_data(data)
+            # Convert old field names to new format on a copy, so rows shared
+            # with other report handlers keep their original keys
+            renamed = {k: v for k, v in entry.items() if k not in _FIELD_RENAMES}
+            for old_name, new_name in _FIELD_RENAMES.items():
+                if old_name in entry:
+                    renamed[new_name] = entry[old_name]
+            converted.append(renamed)
+
+        return validate_report_data(converted)
 
     def read(self) -> ReportData:
         """Read data from the JSON report file.
@@ -122,6 +149,57 @@ class JSONReportHandler(BaseReportHandler):
         except Exception as e:
             raise JSONReportError(f"Error processing report data: {e}")
 
+    @contextmanager
+    def stream(self) -> Iterator[Callable[[ReportData], None]]:
+        """Write report entries batch by batch as they are produced.
+
+        The output is identical to :meth:`write` with the same entries: each
+        entry is serialized on its own and placed inside the enclosing array.
+        The file is opened with the first entry, so an existing report is left
+        alone if the block raises before producing any, and a partially written
+        report is removed.
+
+        Raises:
+            JSONReportError: If there's an error writing or validating the report
+        """
+        f: Optional[IO[str]] = None
+
+        def open_report() -> IO[str]:
+            try:
+                self.validate_path()
+                return self.filepath.open("w", encoding="utf-8")
+            except OSError as e:
+                raise JSONReportError(f"Error writing JSON report: {e}")
+
+        def write_entries(data: ReportData) -> None:
+            nonlocal f
+            try:
+                for entry in self._validate_data(data):
+                    item = _encode_entry(entry)
+                    if f is None:
+                        f = open_report()
+                        f.write("[\n" + item)
+                    else:
+                        f.write(",\n" + item)
+            except OSError as e:
+                raise JSONReportError(f"Error writing JSON report: {e}")
+            except (TypeError, ValueError) as e:
+                raise JSONReportError(f"Error processing report data: {e}")
+
+        try:
+            yield write_entries
+            if f is None:
+                f = open_report()
+                f.write("[]")
+            else:
+                f.write("\n]")
+        except BaseException:
+            if f is not None:
+                f.close()
+                self.filepath.unlink(missing_ok=True)
+            raise
+        f.close()
+
     def append(self, entry: ReportEntry) -> None:
         """Append a single entry to the JSON report.
 
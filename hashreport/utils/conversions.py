@@ -1,9 +1,22 @@
 """Utility functions for unit conversions."""
 
 import re
+import time
+from functools import lru_cache
 from typing import Optional
 
+_SIZE_PATTERN = re.compile(r"^([\d.]+)\s*([KMGT]?B)$")
+_SIZE_MULTIPLIERS = {
+    "B": 1,
+    "KB": 1024,
+    "MB": 1024**2,
+    "GB": 1024**3,
+    "TB": 1024**4,
+}
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+
+@lru_cache(maxsize=64)
 def parse_size(size_str: str) -> Optional[int]:
     """
     Parse size string with units into bytes.
@@ -16,22 +29,14 @@ def parse_size(size_str: str) -> Optional[int]:
     # Strip whitespace and convert to uppercase
     size_str = size_str.strip().upper()
 
-    pattern = r"^([\d.]+)\s*([KMGT]?B)$"
-    match = re.match(pattern, size_str)
+    match = _SIZE_PATTERN.match(size_str)
     if not match:
         return None
 
     number, unit = match.groups()
-    multipliers = {
-        "B": 1,
-        "KB": 1024,
-        "MB": 1024**2,
-        "GB": 1024**3,
-        "TB": 1024**4,
-    }
 
     try:
-        return int(float(number) * multipliers[unit])
+        return int(float(number) * _SIZE_MULTIPLIERS[unit])
     except (ValueError, KeyError):
         return None
 
@@ -169,3 +174,12 @@ def format_size(size_bytes: int) -> str:
             return f"{size_bytes:.2f} {unit}"
 
     return f"{size_bytes:.2f} TB"
+
+
+def format_timestamp(timestamp: float) -> str:
+    """Format a POSIX timestamp as local ``YYYY-MM-DD HH:MM:SS``.
+
+    Uses ``time.strftime`` directly, skipping the ``datetime`` object that
+    ``datetime.fromtimestamp(...).strftime`` builds for every call.
+    """
+    return time.strftime(_TIMESTAMP_FORMAT, time.localtime(timestamp))
@@ -2,6 +2,7 @@
 
 import logging
 import os
+import re
 import smtplib
 from email import encoders
 from email.mime.base import MIMEBase
@@ -11,6 +12,8 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+_HOSTNAME_PATTERN = re.compile(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
 
 class EmailSender:
     """Handle email sending functionality."""
@@ -45,9 +48,7 @@ class EmailSender:
     @staticmethod
     def _validate_hostname(hostname: str) -> str:
         """Validate and sanitize hostname."""
-        import re
-
-        if not re.match(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", hostname):
+        if not _HOSTNAME_PATTERN.match(hostname):
             raise ValueError("Invalid hostname format")
         return hostname
 
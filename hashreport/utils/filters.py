@@ -2,20 +2,52 @@
 
 import fnmatch
 import logging
+import os
 import re
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Pattern, Union
-
-
-def compile_patterns(
-    patterns: List[str],
-    use_regex: bool = False,
-    case_sensitive: bool = False,
-) -> List[Union[str, Pattern]]:
-    """Compile file matching patterns."""
-    if not patterns:
-        return []
-
+from typing import (
+    Callable,
+    FrozenSet,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+# Globs follow fnmatch.fnmatch semantics: case-insensitive only where the
+# platform normalizes path case (e.g. Windows).
+_GLOB_FLAGS = 0 if os.path.normcase("A") == "A" else re.IGNORECASE
+
+# Characters that make a glob more than a literal string
+_GLOB_MAGIC = re.compile(r"[*?[]")
+
+# A filesystem path or a directory entry yielded by os.scandir
+FileRef = Union[str, os.DirEntry]
+
+# Only POSIX paths have a single separator that a plain split can rely on
+_SEP = None if os.altsep else os.sep
+
+
+def _basename(path: FileRef) -> str:
+    """Return the final path component, avoiding os.path.basename when possible."""
+    if isinstance(path, str):
+        if _SEP:
+            return path.rpartition(_SEP)[2]
+        return os.path.basename(path)
+    if isinstance(path, os.DirEntry):
+        return path.name
+    return os.path.basename(path)
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(
+    patterns: Tuple[str, ...], use_regex: bool, case_sensitive: bool
+) -> Tuple[Pattern, ...]:
+    """Compile a tuple of patterns once per unique argument set."""
     if use_regex:
         flags = 0 if case_sensitive else re.IGNORECASE
         # Add multiline for matching start/end of lines
@@ -23,147 +55,239 @@ def compile_patterns(
         # Add verbose flag for cleaner pattern formatting
         flags |= re.VERBOSE
         try:
-            return [re.compile(p, flags) for p in patterns]
+            return tuple(re.compile(p, flags) for p in patterns)
         except re.error as e:
             logging.error(f"Invalid regex pattern in patterns: {e}")
-            return []
-    return patterns
-
+            return ()
 
-def _match_regex_pattern(
-    filename: str, pattern: Union[str, Pattern], case_sensitive: bool = False
-) -> bool:
-    """Match a single regex pattern against filename."""
     try:
-        if isinstance(pattern, Pattern):
-            return bool(pattern.search(filename))
+        # Anchor at the start so search() behaves like fnmatch's full match
+        return tuple(
+            re.compile(r"\A" + fnmatch.translate(p), _GLOB_FLAGS) for p in patterns
+        )
+    except re.error as e:
+        logging.warning(f"Error compiling glob patterns: {e}")
+        return ()
+
+
+@lru_cache(maxsize=256)
+def _compile_single(
+    pattern: str, use_regex: bool, case_sensitive: bool
+) -> Optional[Pattern]:
+    """Compile one raw pattern, returning None if it is invalid.
+
+    Regexes get only the case flag, matching a plain ``re.search`` call.
+    """
+    try:
+        if use_regex:
+            return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+        return re.compile(r"\A" + fnmatch.translate(pattern), _GLOB_FLAGS)
+    except re.error as e:
+        logging.warning(f"Error compiling pattern '{pattern}': {e}")
+        return None
+
+
+@lru_cache(maxsize=256)
+def _compile_fused(
+    patterns: Tuple[str, ...], use_regex: bool, case_sensitive: bool
+) -> Tuple[Pattern, ...]:
+    """Fuse a pattern set into a single alternation so each file needs one search.
+
+    Regex sets containing capture groups are left unfused, since joining them
+    would renumber groups and break backreferences.
+    """
+    compiled = _compile_cached(patterns, use_regex, case_sensitive)
+    if len(compiled) < 2 or (use_regex and any(p.groups for p in compiled)):
+        return compiled
+
+    # A trailing newline ends any verbose-mode comment inside a regex pattern
+    end = "\n" if use_regex else ""
+    try:
+        fused = "|".join(f"(?:{p.pattern}{end})" for p in compiled)
+        return (re.compile(fused, compiled[0].flags),)
+    except re.error:
+        return compiled
+
+
+def _split_plain_globs(
+    patterns: Tuple[str, ...],
+) -> Tuple[FrozenSet[str], Tuple[str, ...], Tuple[str, ...]]:
+    """Separate globs that need no regex from the rest.
+
+    A glob without wildcards is an exact file name, and ``*`` followed by
+    literal text is a suffix, so a set lookup or ``str.endswith`` can test
+    them. Returns the exact names, the suffixes and the remaining globs.
+    """
+    names = set()
+    suffixes = []
+    rest = []
+    for pattern in patterns:
+        if not _GLOB_MAGIC.search(pattern):
+            names.add(pattern)
+        elif pattern.startswith("*") and not _GLOB_MAGIC.search(pattern, 1):
+            suffixes.append(pattern[1:])
         else:
-            flags = 0 if case_sensitive else re.IGNORECASE
-            return bool(re.search(pattern, filename, flags))
-    except (re.error, TypeError) as e:
-        logging.warning(f"Error matching regex pattern '{pattern}': {e}")
+            rest.append(pattern)
+    return frozenset(names), tuple(suffixes), tuple(rest)
+
+
+def _build_name_matcher(
+    patterns: Tuple[str, ...], use_regex: bool
+) -> Callable[[str], bool]:
+    """Return a predicate telling whether a file name matches any pattern."""
+    names: FrozenSet[str] = frozenset()
+    suffixes: Tuple[str, ...] = ()
+    # Plain string tests are only equivalent where globs are case-sensitive
+    if not use_regex and not _GLOB_FLAGS:
+        names, suffixes, patterns = _split_plain_globs(patterns)
+    compiled = _compile_fused(patterns, use_regex, False) if patterns else ()
+
+    def matches(name: str) -> bool:
+        if name in names:
+            return True
+        if suffixes and name.endswith(suffixes):
+            return True
+        for pattern in compiled:
+            if pattern.search(name):
+                return True
         return False
 
+    return matches
 
-def _match_glob_pattern(filename: str, pattern: str) -> bool:
-    """Match a single glob pattern against filename."""
-    try:
-        return fnmatch.fnmatch(filename, pattern)
-    except Exception as e:
-        logging.warning(f"Error matching glob pattern '{pattern}': {e}")
-        return False
 
-
-def _match_single_pattern(
-    filename: str,
-    pattern: Union[str, Pattern],
+def compile_patterns(
+    patterns: Optional[Sequence[str]],
     use_regex: bool = False,
     case_sensitive: bool = False,
-) -> bool:
-    """Match a single pattern against filename."""
-    if use_regex:
-        return _match_regex_pattern(filename, pattern, case_sensitive)
-    else:
-        return _match_glob_pattern(filename, str(pattern))
+) -> List[Pattern]:
+    """Compile file matching patterns.
+
+    Glob patterns are translated to regular expressions so every result can be
+    matched with ``search``. Compiled results are cached per pattern set.
+    """
+    if not patterns:
+        return []
+    return list(_compile_cached(tuple(patterns), use_regex, case_sensitive))
 
 
 def matches_pattern(
-    path: str,
-    patterns: List[Union[str, Pattern]],
+    path: FileRef,
+    patterns: Sequence[Union[str, Pattern]],
     use_regex: bool = False,
     case_sensitive: bool = False,
 ) -> bool:
-    """Check if path matches any pattern."""
+    """Check if path matches any pattern.
+
+    Patterns should come from :func:`compile_patterns`; raw strings are
+    compiled (and cached) on the fly, and invalid ones are skipped.
+    """
     if not patterns:
         return False
 
     # Only match against filename
-    filename = Path(path).name
+    filename = _basename(path)
 
     for pattern in patterns:
-        if _match_single_pattern(filename, pattern, use_regex, case_sensitive):
+        if not isinstance(pattern, Pattern):
+            pattern = _compile_single(pattern, use_regex, case_sensitive)
+            if pattern is None:
+                continue
+        if pattern.search(filename):
             return True
 
     return False
 
 
-def _validate_file_basic(file_path: str) -> bool:
-    """Validate basic file properties."""
-    try:
-        path = Path(file_path)
-        return path.is_file()
-    except Exception as e:
-        logging.error(f"Error validating file {file_path}: {e}")
+def _size_within(
+    size: int, min_size: Optional[int] = None, max_size: Optional[int] = None
+) -> bool:
+    """Check a file size against optional bounds."""
+    if min_size is not None and (min_size < 0 or size < min_size):
         return False
+    if max_size is not None and (max_size < 0 or size > max_size):
+        return False
+    return True
 
 
-def _validate_file_size(
-    file_path: str, min_size: Optional[int] = None, max_size: Optional[int] = None
+def _validate_file(
+    file_path: FileRef, min_size: Optional[int] = None, max_size: Optional[int] = None
 ) -> bool:
-    """Validate file size constraints."""
-    try:
-        size = Path(file_path).stat().st_size
+    """Validate that the path is a regular file within the size constraints.
 
-        if min_size is not None and (min_size < 0 or size < min_size):
-            return False
-        if max_size is not None and (max_size < 0 or size > max_size):
+    Paths are checked with a single stat call. Directory entries use their
+    cached file type and are only stat'ed when a size bound is set.
+    """
+    try:
+        if isinstance(file_path, os.DirEntry):
+            if not file_path.is_file():
+                return False
+            if min_size is None and max_size is None:
+                return True
+            return _size_within(file_path.stat().st_size, min_size, max_size)
+
+        st = Path(file_path).stat()
+        if not stat.S_ISREG(st.st_mode):
             return False
-
-        return True
+        return _size_within(st.st_size, min_size, max_size)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
     except Exception as e:
-        logging.error(f"Error validating file size for {file_path}: {e}")
+        logging.error(f"Error validating file {os.fspath(file_path)}: {e}")
         return False
 
 
-def _validate_include_patterns(
-    file_path: str,
+def build_file_filter(
     include_patterns: Optional[List[str]] = None,
-    use_regex: bool = False,
-) -> bool:
-    """Validate include patterns."""
-    if not include_patterns:
-        return True
-
-    includes = compile_patterns(include_patterns, use_regex)
-    return matches_pattern(file_path, includes, use_regex)
-
-
-def _validate_exclude_patterns(
-    file_path: str,
     exclude_patterns: Optional[List[str]] = None,
     use_regex: bool = False,
-) -> bool:
-    """Validate exclude patterns."""
-    if not exclude_patterns:
-        return True
-
-    excludes = compile_patterns(exclude_patterns, use_regex)
-    return not matches_pattern(file_path, excludes, use_regex)
+    min_size: Optional[int] = None,
+    max_size: Optional[int] = None,
+) -> Callable[[FileRef], bool]:
+    """Build a reusable file filter with its patterns compiled once.
+
+    Use this instead of :func:`should_process_file` when the same filters are
+    applied to many files, such as during a directory scan.
+    """
+    is_included = (
+        _build_name_matcher(tuple(include_patterns), use_regex)
+        if include_patterns
+        else None
+    )
+    is_excluded = (
+        _build_name_matcher(tuple(exclude_patterns), use_regex)
+        if exclude_patterns
+        else None
+    )
+
+    def file_filter(file_path: FileRef) -> bool:
+        # Pattern checks are pure string work, so run them before any stat call
+        if is_excluded or is_included:
+            filename = _basename(file_path)
+            if is_excluded and is_excluded(filename):
+                return False
+            # Requested include patterns that failed to compile match nothing
+            if is_included and not is_included(filename):
+                return False
+
+        return _validate_file(file_path, min_size, max_size)
+
+    return file_filter
 
 
 def should_process_file(
-    file_path: str,
+    file_path: FileRef,
     include_patterns: Optional[List[str]] = None,
     exclude_patterns: Optional[List[str]] = None,
     use_regex: bool = False,
     min_size: Optional[int] = None,
     max_size: Optional[int] = None,
 ) -> bool:
-    """Determine if a file should be processed based on filters."""
-    # Basic file validation
-    if not _validate_file_basic(file_path):
-        return False
-
-    # Size validation
-    if not _validate_file_size(file_path, min_size, max_size):
-        return False
-
-    # Exclude patterns validation
-    if not _validate_exclude_patterns(file_path, exclude_patterns, use_regex):
-        return False
-
-    # Include patterns validation
-    if not _validate_include_patterns(file_path, include_patterns, use_regex):
-        return False
-
-    return True
+    """Determine if a file should be processed based on filters.
+
+    ``file_path`` may be an ``os.DirEntry`` from ``os.scandir``, in which case
+    its cached file type and stat results are used instead of new syscalls.
+    """
+    file_filter = build_file_filter(
+        include_patterns, exclude_patterns, use_regex, min_size, max_size
+    )
+    return file_filter(file_path)
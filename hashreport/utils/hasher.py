@@ -1,15 +1,16 @@
 """Utilities for file hashing and metadata collection."""
 
-import datetime
 import hashlib
 import logging
 import mmap
 import os
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from hashreport.config import get_config
+from hashreport.utils.conversions import format_timestamp
 
 logger = logging.getLogger(__name__)
 
@@ -17,36 +18,74 @@ logger = logging.getLogger(__name__)
 config = get_config()
 
 
+@lru_cache(maxsize=None)
+def _get_hasher_prototype(algorithm: str) -> Any:
+    """Return a pristine hasher for the algorithm, created once.
+
+    Copying this prototype is cheaper than resolving the algorithm through
+    ``hashlib.new`` for every file.
+    """
+    return hashlib.new(algorithm)
+
+
+def _advise_sequential(mm: mmap.mmap) -> None:
+    """Hint the kernel that a mapping will be read front to back."""
+    advice = getattr(mmap, "MADV_SEQUENTIAL", None)
+    if advice is None:
+        return
+    try:
+        mm.madvise(advice)
+    except OSError:
+        pass
+
+
 @contextmanager
 def get_file_reader(file_path: str, use_mmap: bool = True):
     """Get optimal file reader based on file size and system resources."""
     path = Path(file_path)
-    file_size = path.stat().st_size
 
-    with path.open("rb") as f:
+    # Unbuffered: callers read whole chunks with readinto()
+    with path.open("rb", buffering=0) as f:
+        file_size = os.fstat(f.fileno()).st_size
+        mm: Optional[mmap.mmap] = None
         if (
             use_mmap and file_size > 0 and file_size >= config.mmap_threshold
         ):  # Only use mmap for files over threshold
             try:
-                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-                    yield mm
-                return
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
             except Exception:
                 # Fall back to regular file reading if mmap fails
-                f.seek(0)
-        yield f
+                mm = None
+
+        if mm is None:
+            yield f
+            return
+
+        with mm:
+            _advise_sequential(mm)
+            yield mm
 
 
 def calculate_hash(
-    filepath: str, algorithm: Optional[str] = None
+    filepath: str,
+    algorithm: Optional[str] = None,
+    stat_result: Optional[os.stat_result] = None,
 ) -> Tuple[str, Optional[str], str]:
-    """Calculate hash for a file."""
+    """Calculate hash for a file.
+
+    Args:
+        filepath: Path of the file to hash
+        algorithm: Hash algorithm, defaults to the configured algorithm
+        stat_result: Optional stat of ``filepath`` already taken by the caller
+    """
     algorithm = algorithm or config.default_algorithm
     try:
-        hasher = hashlib.new(algorithm)
+        hasher = _get_hasher_prototype(algorithm).copy()
 
+        # One stat supplies both the size and the modification time
+        st = stat_result or os.stat(filepath)
+        file_size = st.st_size
         # Use mmap for large files
-        file_size = os.path.getsize(filepath)
         use_mmap = file_size > config.mmap_threshold  # e.g., 10MB
 
         with get_file_reader(filepath, use_mmap=use_mmap) as f:
@@ -54,13 +93,20 @@ def calculate_hash(
             if isinstance(f, mmap.mmap):
                 hasher.update(f)
             else:
-                # For regular files, read in chunks
-                for chunk in iter(lambda: f.read(config.chunk_size), b""):
-                    hasher.update(chunk)
-
-        mod_time = datetime.datetime.fromtimestamp(os.path.getmtime(filepath)).strftime(
-            "%Y-%m-%d %H:%M:%S"
-        )
+                # For regular files, fill one reusable buffer per chunk;
+                # small files only need a buffer as large as themselves. A size
+                # of 0 may be unreported (e.g. /proc), so it gets a full chunk.
+                buffer = bytearray(
+                    min(config.chunk_size, file_size) or config.chunk_size
+                )
+                view = memoryview(buffer)
+                while True:
+                    read = f.readinto(buffer)
+                    if not read:
+                        break
+                    hasher.update(view[:read])
+
+        mod_time = format_timestamp(st.st_mtime)
 
         return filepath, hasher.hexdigest(), mod_time
     except Exception as e:
@@ -1,33 +1,44 @@
 """Logging configuration for hashreport."""
 
 import logging
-from typing import Optional
+from typing import Optional, Tuple
+
+_LOGGER = logging.getLogger("hashreport")
+_configured: Optional[Tuple[int, bool]] = None
 
 
 def setup_logging(level: Optional[int] = None, debug: bool = False) -> None:
     """Set up logging configuration.
 
+    Repeated calls with the same settings return early.
+
     Args:
         level: Optional logging level. Defaults to INFO if not specified.
         debug: Enable debug logging
     """
+    global _configured
+
     if debug:
         level = logging.DEBUG
     elif level is None:
         level = logging.INFO
 
-    logger = logging.getLogger("hashreport")
-    logger.setLevel(level)
+    if _configured == (level, debug) and _LOGGER.level == level and _LOGGER.handlers:
+        return
 
-    if not logger.handlers:
+    _LOGGER.setLevel(level)
+
+    if not _LOGGER.handlers:
         handler = logging.StreamHandler()
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        _LOGGER.addHandler(handler)
 
     # Enable debug logging for specific modules
     if debug:
         logging.getLogger("hashreport.utils.scanner").setLevel(logging.DEBUG)
         logging.getLogger("hashreport.reports").setLevel(logging.DEBUG)
+
+    _configured = (level, debug)
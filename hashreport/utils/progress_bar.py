@@ -38,11 +38,15 @@ class ProgressBar:
         self.pbar: Optional[tqdm] = None
 
     def update(self, n: int = 1, file_name: str = "") -> None:
-        """Update progress by n steps."""
+        """Update progress by n steps.
+
+        The file name is stored without forcing a repaint; tqdm redraws it
+        together with the count at most once per ``mininterval``.
+        """
         with self._lock:
             if self._show_file_names and file_name:
                 self._current_file = file_name
-                self._bar.set_postfix_str(file_name)
+                self._bar.set_postfix_str(file_name, refresh=False)
             self._bar.update(n)
 
     def finish(self) -> None:
@@ -1,10 +1,26 @@
 """Provides functions to scan directories, calculate hashes, and log results."""
 
+import glob
 import logging
 import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import click
 
@@ -12,17 +28,36 @@ from hashreport.config import get_config
 from hashreport.reports.base import BaseReportHandler
 from hashreport.reports.csv_handler import CSVReportHandler
 from hashreport.reports.json_handler import JSONReportHandler
-from hashreport.utils.conversions import format_size, parse_size_string
+from hashreport.utils.conversions import (
+    format_size,
+    format_timestamp,
+    parse_size_string,
+)
 from hashreport.utils.exceptions import HashReportError
-from hashreport.utils.filters import should_process_file as filter_should_process_file
+from hashreport.utils.filters import build_file_filter
 from hashreport.utils.hasher import calculate_hash
 from hashreport.utils.progress_bar import ProgressBar
+from hashreport.utils.thread_pool import ThreadPoolManager
 from hashreport.utils.type_defs import ReportData
 
 logger = logging.getLogger(__name__)
 
 config = get_config()
 
+# Tasks per worker in each batch: enough for load balancing, few enough that
+# per-task scheduling cost is paid per chunk of files rather than per file
+_CHUNKS_PER_WORKER = 4
+
+# Directory listings each walk worker may have queued or unconsumed, so a
+# parallel walk reads only a little ahead of the entries it yields
+_LISTINGS_PER_WORKER = 2
+
+# Report handler class for each supported output file extension
+_REPORT_HANDLERS: Dict[str, Type[BaseReportHandler]] = {
+    ".csv": CSVReportHandler,
+    ".json": JSONReportHandler,
+}
+
 
 def get_report_handlers(filenames: List[str]) -> List[BaseReportHandler]:
     """Get report handlers for the given filenames.
@@ -36,21 +71,18 @@ def get_report_handlers(filenames: List[str]) -> List[BaseReportHandler]:
     handlers: List[BaseReportHandler] = []
     for filename in filenames:
         path = Path(filename)
-        handler: BaseReportHandler
-        if path.suffix.lower() == ".csv":
-            handler = CSVReportHandler(path)
-        elif path.suffix.lower() == ".json":
-            handler = JSONReportHandler(path)
-        else:
+        handler_class = _REPORT_HANDLERS.get(path.suffix.lower())
+        if not handler_class:
             raise HashReportError(f"Unsupported file format: {path.suffix}")
-        handlers.append(handler)
-    return cast(List[BaseReportHandler], handlers)
+        handlers.append(handler_class(path))
+    return handlers
 
 
 def get_report_filename(
     output_path: str,
     output_format: Optional[str] = None,
     prefix: str = "hashreport",
+    timestamp: Optional[str] = None,
 ) -> str:
     """Generate report filename with timestamp.
 
@@ -58,8 +90,10 @@ def get_report_filename(
         output_path: Base output path
         output_format: Optional format override (json/csv)
         prefix: Optional prefix for the filename
+        timestamp: Optional preformatted timestamp, so reports written in
+            several formats for one scan share the same name
     """
-    timestamp = datetime.now().strftime(config.timestamp_format)
+    timestamp = timestamp or datetime.now().strftime(config.timestamp_format)
     path = Path(output_path)
 
     # Force format extension
@@ -73,6 +107,13 @@ def get_report_filename(
     return str(path.with_suffix(ext))
 
 
+def _literal_name_pattern(name: str, regex: bool) -> str:
+    """Return a pattern matching exactly the given file name."""
+    if regex:
+        return rf"\A{re.escape(name)}\Z"
+    return glob.escape(name)
+
+
 def _convert_scanner_params_to_filter_params(
     exclude_paths: Optional[Set[str]] = None,
     file_extension: Optional[str] = None,
@@ -106,16 +147,19 @@ def _convert_scanner_params_to_filter_params(
     if file_names:
         if include_patterns is None:
             include_patterns = []
-        include_patterns.extend(file_names)
+        include_patterns.extend(
+            _literal_name_pattern(name, regex) for name in sorted(file_names)
+        )
 
     # Handle exclude_paths by adding them to exclude_patterns
     if exclude_paths:
         if exclude_patterns is None:
             exclude_patterns = []
-        # Convert full paths to filename patterns for exclusion
-        for path in exclude_paths:
-            filename = os.path.basename(path)
-            exclude_patterns.append(filename)
+        # Convert full paths to filename patterns for exclusion, once per scan
+        filenames = {os.path.basename(path) for path in exclude_paths}
+        exclude_patterns.extend(
+            _literal_name_pattern(name, regex) for name in sorted(filenames)
+        )
 
     return {
         "include_patterns": include_patterns,
@@ -126,19 +170,89 @@ def _convert_scanner_params_to_filter_params(
     }
 
 
+def _list_directory(path: str, recursive: bool) -> Tuple[List[os.DirEntry], List[str]]:
+    """Split one directory listing into non-directory entries and subdirectories.
+
+    Symlinked directories are not returned for descent and an unreadable
+    directory yields nothing, matching os.walk.
+    """
+    files: List[os.DirEntry] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(entry)
+                elif recursive and not entry.is_symlink():
+                    subdirs.append(entry.path)
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def _iter_file_entries(
+    directory: Union[str, Path],
+    recursive: bool = True,
+    workers: Optional[int] = None,
+) -> Iterator[os.DirEntry]:
+    """Yield non-directory entries below directory in os.walk top-down order.
+
+    Uses os.scandir with an explicit stack so file type and stat data cached on
+    each DirEntry can be reused by the filters. With more than one worker,
+    the next few subdirectories are listed ahead of time on a thread pool so
+    directory reads overlap; the order of the yielded entries is unchanged.
+    """
+    workers = workers or config.walk_workers
+    root = os.fspath(Path(directory))
+
+    if workers <= 1:
+        stack = [root]
+        while stack:
+            files, subdirs = _list_directory(stack.pop(), recursive)
+            yield from files
+            # Reverse so subdirectories are visited in listing order
+            stack.extend(reversed(subdirs))
+        return
+
+    limit = workers * _LISTINGS_PER_WORKER
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        # Directories still to visit, as paths or as listings already submitted
+        stack: List[Union[str, Future]] = [root]
+        in_flight = 0
+        while stack:
+            # Submit listings for the directories visited next, up to the limit
+            for i in range(len(stack) - 1, -1, -1):
+                if in_flight >= limit:
+                    break
+                path = stack[i]
+                if isinstance(path, str):
+                    stack[i] = executor.submit(_list_directory, path, recursive)
+                    in_flight += 1
+            listing = cast(Future, stack.pop())
+            in_flight -= 1
+            files, subdirs = listing.result()
+            stack.extend(reversed(subdirs))
+            yield from files
+    finally:
+        # Stop listing ahead if the caller stopped early (e.g. --limit)
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def count_files(directory: Path, recursive: bool, **filter_kwargs) -> int:
     """Count files matching filter criteria."""
     # Convert old-style parameters to new filter parameters
     converted_params = _convert_scanner_params_to_filter_params(**filter_kwargs)
 
+    file_filter = build_file_filter(**converted_params)
     total = 0
-    for root, dirs, files in os.walk(directory):
-        if not recursive:
-            dirs[:] = []
-        for file_name in files:
-            file_path = os.path.join(root, file_name)
-            if filter_should_process_file(file_path, **converted_params):
-                total += 1
+    for entry in _iter_file_entries(directory, recursive):
+        if file_filter(entry):
+            total += 1
     return total
 
 
@@ -191,107 +305,131 @@ def _collect_files_to_process(
     recursive: bool = True,
 ) -> List[str]:
     """Collect files to process based on specific files or directory walk."""
-    if specific_files:
-        return [
-            f for f in specific_files if filter_should_process_file(f, **filter_params)
-        ]
+    file_filter = build_file_filter(**filter_params)
     files_to_process: List[str] = []
-    directory_path = Path(directory)
-    for root, dirs, files in os.walk(directory_path):
-        if not recursive:
-            dirs[:] = []
-        for file_name in files:
-            file_path = os.path.join(root, file_name)
-            if filter_should_process_file(file_path, **filter_params):
+    if specific_files:
+        # The caller already enumerated the targets, so never walk the tree;
+        # sort the set so a limit always keeps the same files
+        for file_path in sorted(specific_files):
+            if file_filter(file_path):
                 files_to_process.append(file_path)
                 if limit and len(files_to_process) >= limit:
                     break
-        if limit and len(files_to_process) >= limit:
-            break
+        return files_to_process
+    for entry in _iter_file_entries(directory, recursive):
+        if file_filter(entry):
+            files_to_process.append(entry.path)
+            if limit and len(files_to_process) >= limit:
+                break
     return files_to_process
 
 
+def _hash_file(
+    path: str, algorithm: str
+) -> Tuple[str, Optional[str], str, Optional[os.stat_result]]:
+    """Hash a file and return its stat result alongside the hash.
+
+    The file is stat'ed once; the result feeds both the hasher and the
+    report row, and is None if the file could not be stat'ed.
+    """
+    try:
+        st = os.stat(path)
+    except OSError as e:
+        logger.error(f"Error hashing file {path}: {e}")
+        return path, None, "", None
+    return (*calculate_hash(path, algorithm, st), st)
+
+
 def _process_single_batch(
-    batch: List[str], algorithm: str, progress_bar: ProgressBar
+    pool: ThreadPoolManager,
+    batch: List[str],
+    algorithm: str,
+    progress_bar: ProgressBar,
 ) -> List[Dict[str, str]]:
-    """Process a single batch of files and return results."""
-    from hashreport.utils.thread_pool import ThreadPoolManager
-
+    """Process a single batch of files on an open pool and return results."""
     results = []
-    with ThreadPoolManager(
-        initial_workers=config.max_workers,
-        progress_bar=None,  # Don't let thread pool handle progress
-    ) as pool:
-        # Update progress bar with first file in batch
-        if batch:
-            progress_bar.update(0, file_name=os.path.basename(batch[0]))
-
-        # Process the batch
-        hash_results = pool.process_items(batch, lambda x: calculate_hash(x, algorithm))
-
-        # Handle results and update progress
-        for result in hash_results:
-            path, hash_val, mod_time = result
-            if hash_val:  # Only add if hash was successful
-                file_path = Path(path)
-                file_size = os.path.getsize(path)
-                results.append(
-                    {
-                        "File Name": file_path.name,
-                        "File Path": str(file_path),
-                        "Size": format_size(file_size),
-                        "Hash Algorithm": algorithm,
-                        "Hash Value": hash_val,
-                        "Last Modified Date": mod_time,
-                        "Created Date": datetime.fromtimestamp(
-                            os.path.getctime(path)
-                        ).strftime("%Y-%m-%d %H:%M:%S"),
-                    }
-                )
-                # Update progress bar with current file name
-                progress_bar.update(1, file_name=file_path.name)
+
+    # Update progress bar with first file in batch
+    if batch:
+        progress_bar.update(0, file_name=os.path.basename(batch[0]))
+
+    # Hand files to the pool in chunks, one pool task per chunk
+    chunk_size = max(1, len(batch) // (pool.current_workers * _CHUNKS_PER_WORKER))
+    hash_results = pool.process_items(
+        batch, lambda path: _hash_file(path, algorithm), chunksize=chunk_size
+    )
+
+    # Handle results
+    for path, hash_val, mod_time, st in hash_results:
+        if hash_val and st:  # Only add if hash was successful
+            file_path = Path(path)
+            results.append(
+                {
+                    "File Name": file_path.name,
+                    "File Path": str(file_path),
+                    "Size": format_size(st.st_size),
+                    "Hash Algorithm": algorithm,
+                    "Hash Value": hash_val,
+                    "Last Modified Date": mod_time,
+                    "Created Date": format_timestamp(st.st_ctime),
+                }
+            )
+
+    # One progress update per batch rather than one per file
+    if results:
+        progress_bar.update(len(results), file_name=results[-1]["File Name"])
 
     return results
 
 
 def _process_file_batches(
-    files_to_process: List[str], algorithm: str, progress_bar: ProgressBar
-) -> List[Dict[str, str]]:
-    """Process files in batches and return all results."""
-    final_results = []
-
-    # Process files in batches
+    pool: ThreadPoolManager,
+    files_to_process: List[str],
+    algorithm: str,
+    progress_bar: ProgressBar,
+) -> Iterator[List[Dict[str, str]]]:
+    """Process files in batches, yielding each batch's results as it completes.
+
+    Every batch runs on the caller's pool, so worker threads and the resource
+    monitor are started once per scan rather than once per batch.
+    """
     batch_size = min(config.batch_size, len(files_to_process)) or 1
     for i in range(0, len(files_to_process), batch_size):
         batch = files_to_process[i : i + batch_size]
-        batch_results = _process_single_batch(batch, algorithm, progress_bar)
-        final_results.extend(batch_results)
-
-    return final_results
+        yield _process_single_batch(pool, batch, algorithm, progress_bar)
 
 
 def _write_scan_results(
     handlers: List[BaseReportHandler],
-    final_results: List[Dict[str, str]],
+    result_batches: Iterable[List[Dict[str, str]]],
     output_files: Union[str, List[str]],
 ) -> List[str]:
-    """Write scan results to all handlers and return report paths."""
+    """Stream scan results to all handlers and return report paths.
+
+    Each batch is written to every report as soon as it is produced, so
+    rows are not accumulated for the whole scan.
+    """
     output_list: List[str] = cast(
         List[str],
         [output_files] if isinstance(output_files, str) else output_files,
     )
-    reports: List[str] = []
     for handler in handlers:
-        if not hasattr(handler, "write"):
+        if not hasattr(handler, "stream"):
             click.echo(
-                f"Error: Handler {type(handler).__name__} missing write method",
+                f"Error: Handler {type(handler).__name__} missing stream method",
                 err=True,
             )
             return []
-        logger.debug(f"Writing {len(final_results)} results to {output_list}")
-        handler.write(cast(ReportData, final_results))
-        reports.append(str(handler.filepath))
-    return reports
+
+    written = 0
+    with ExitStack() as stack:
+        writers = [stack.enter_context(handler.stream()) for handler in handlers]
+        for batch in result_batches:
+            for write_rows in writers:
+                write_rows(cast(ReportData, batch))
+            written += len(batch)
+    logger.debug(f"Wrote {written} results to {output_list}")
+    return [str(handler.filepath) for handler in handlers]
 
 
 def walk_directory_and_log(
@@ -352,13 +490,25 @@ def walk_directory_and_log(
         )
         progress_bar = pbar
 
-        final_results = _process_file_batches(files_to_process, algorithm, pbar)
+        with ExitStack() as stack:
+            result_batches: Iterable[List[Dict[str, str]]] = ()
+            # Only start worker threads when there is something to hash
+            if files_to_process:
+                pool = stack.enter_context(
+                    ThreadPoolManager(
+                        initial_workers=config.max_workers,
+                        progress_bar=None,  # Don't let thread pool handle progress
+                    )
+                )
+                result_batches = _process_file_batches(
+                    pool, files_to_process, algorithm, pbar
+                )
 
-        reports = _write_scan_results(
-            handlers,
-            final_results,
-            cast(Union[str, List[str]], output_files),
-        )
+            reports = _write_scan_results(
+                handlers,
+                result_batches,
+                cast(Union[str, List[str]], output_files),
+            )
         success = True
         logger.debug("Successfully wrote results")
 
@@ -4,19 +4,32 @@ import logging
 import os
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Callable, Iterable, List, Optional
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple
 
 import psutil
 
-from hashreport.config import get_config
+from hashreport.config import available_cpu_count, get_config
 from hashreport.utils.progress_bar import ProgressBar
 from hashreport.utils.type_defs import PerformanceSummary
 
 logger = logging.getLogger(__name__)
 config = get_config()
 
+# Upper bound on pool threads per CPU, whatever the caller asks for
+_WORKERS_PER_CPU = 4
+
+# Memory readings closer than this (percentage points) count as stable
+_STABLE_MEMORY_DELTA = 2.0
+# Longest monitor interval, as a multiple of resource_check_interval
+_MAX_INTERVAL_FACTOR = 8
+
+
+def _worker_cap() -> int:
+    """Return the most worker threads a pool may start on this machine."""
+    return max(2, available_cpu_count() * _WORKERS_PER_CPU)
+
 
 @dataclass
 class PerformanceMetrics:
@@ -44,11 +57,18 @@ class PerformanceMetrics:
         if self.start_time:
             self.total_processing_time = self.end_time - self.start_time
 
-    def update_average_processing_time(self, item_time: float) -> None:
-        """Update average processing time."""
+    def update_average_processing_time(
+        self, item_time: float, item_count: int = 1
+    ) -> None:
+        """Update average processing time.
+
+        Args:
+            item_time: Time taken by the most recent ``item_count`` items
+            item_count: Number of items covered by ``item_time``
+        """
         if self.total_items_processed > 0:
             self.average_processing_time = (
-                self.average_processing_time * (self.total_items_processed - 1)
+                self.average_processing_time * (self.total_items_processed - item_count)
                 + item_time
             ) / self.total_items_processed
         else:
@@ -82,6 +102,25 @@ class PerformanceMetrics:
         }
 
 
+def _process_chunk(
+    process_func: Callable, chunk: List[Any]
+) -> Tuple[List[Any], List[Tuple[Any, Exception]]]:
+    """Apply ``process_func`` to every item of a chunk within one task.
+
+    Returns:
+        Results of the items that succeeded, in order, and the items that
+        raised paired with their exception
+    """
+    results = []
+    failures = []
+    for item in chunk:
+        try:
+            results.append(process_func(item))
+        except Exception as e:
+            failures.append((item, e))
+    return results, failures
+
+
 class ResourceMonitor:
     """Monitor system resources and adjust thread pool size with adaptive scaling."""
 
@@ -101,6 +140,9 @@ class ResourceMonitor:
         self._consecutive_reductions = 0
         self._consecutive_increases = 0
         self._max_consecutive_adjustments = 3
+        self._process: Optional[psutil.Process] = None
+        self._interval = config.resource_check_interval
+        self._last_memory_percent: Optional[float] = None
 
     def start(self) -> None:
         """Start resource monitoring."""
@@ -111,6 +153,21 @@ class ResourceMonitor:
         self._stop_event.set()
         self._monitor_thread.join()
 
+    def _update_interval(self, memory_percent: float) -> None:
+        """Back off while memory is stable and poll promptly once it moves.
+
+        The interval doubles for every stable reading, up to
+        ``_MAX_INTERVAL_FACTOR`` times ``resource_check_interval``, and
+        falls back to ``resource_check_interval`` on a larger change.
+        """
+        base = config.resource_check_interval
+        last = self._last_memory_percent
+        if last is not None and abs(memory_percent - last) < _STABLE_MEMORY_DELTA:
+            self._interval = min(self._interval * 2, base * _MAX_INTERVAL_FACTOR)
+        else:
+            self._interval = base
+        self._last_memory_percent = memory_percent
+
     def _monitor_resources(self) -> None:
         """Monitor system resources and adjust thread count with adaptive logic."""
         while not self._stop_event.is_set():
@@ -118,8 +175,11 @@ class ResourceMonitor:
                 current_time = time.time()
 
                 # Get system metrics
-                memory_percent = psutil.Process().memory_percent()
+                if self._process is None:
+                    self._process = psutil.Process()
+                memory_percent = self._process.memory_percent()
                 cpu_percent = psutil.cpu_percent(interval=0.1)
+                self._update_interval(memory_percent)
 
                 # Store metrics for performance tracking
                 self.pool_manager.metrics.memory_usage_samples.append(memory_percent)
@@ -136,7 +196,7 @@ class ResourceMonitor:
                     current_time - self._last_adjustment_time
                     < self._adjustment_cooldown
                 ):
-                    time.sleep(config.resource_check_interval)
+                    self._stop_event.wait(self._interval)
                     continue
 
                 # Adaptive worker adjustment based on resource usage
@@ -148,6 +208,7 @@ class ResourceMonitor:
                         self._consecutive_reductions += 1
                         self._consecutive_increases = 0
                         self._last_adjustment_time = current_time
+                        self._interval = config.resource_check_interval
                         self.pool_manager.metrics.worker_adjustments += 1
                         logger.debug(
                             f"Reduced workers to {self.pool_manager.current_workers} "
@@ -160,6 +221,7 @@ class ResourceMonitor:
                         self._consecutive_increases += 1
                         self._consecutive_reductions = 0
                         self._last_adjustment_time = current_time
+                        self._interval = config.resource_check_interval
                         self.pool_manager.metrics.worker_adjustments += 1
                         logger.debug(
                             f"Increased workers to {self.pool_manager.current_workers} "
@@ -173,7 +235,8 @@ class ResourceMonitor:
 
             except Exception as e:
                 logger.error(f"Resource monitoring error: {e}")
-            time.sleep(config.resource_check_interval)
+            # Wait on the stop event so stop() does not sit out a full interval
+            self._stop_event.wait(self._interval)
 
     def _should_adjust_workers(
         self, memory_percent: float, cpu_percent: float
@@ -213,10 +276,11 @@ class ThreadPoolManager:
         """Initialize thread pool manager.
 
         Args:
-            initial_workers: Number of worker threads to use, defaults to config value
+            initial_workers: Number of worker threads to use, defaults to config
+                value and is capped at a small multiple of the CPU count
             progress_bar: Optional progress bar for tracking operations
         """
-        self.initial_workers = initial_workers or config.max_workers
+        self.initial_workers = min(initial_workers or config.max_workers, _worker_cap())
         self.current_workers = self.initial_workers
         self.max_workers = config.max_workers
         self.min_workers = config.min_workers
@@ -229,7 +293,7 @@ class ThreadPoolManager:
         self._backpressure_threshold = 0.8  # Queue utilization threshold
         self._queue_size = 0
         self._max_queue_size = 0
-        self._submitted_futures: List[Any] = []
+        self._submitted_futures: Set[Future] = set()
 
     def __enter__(self) -> "ThreadPoolManager":
         """Initialize thread pool on context entry."""
@@ -275,7 +339,7 @@ class ThreadPoolManager:
 
         try:
             # Count pending futures (submitted but not completed)
-            pending_futures = len([f for f in self._submitted_futures if not f.done()])
+            pending_futures = sum(1 for f in self._submitted_futures if not f.done())
             self._queue_size = pending_futures
             self._max_queue_size = max(self._max_queue_size, pending_futures)
 
@@ -291,9 +355,17 @@ class ThreadPoolManager:
         return False
 
     def process_batch(
-        self, batch: List[Any], process_func: Callable, retries: int = 0
+        self,
+        batch: List[Any],
+        process_func: Callable,
+        retries: int = 0,
+        chunksize: int = 1,
     ) -> List[Any]:
-        """Process a batch of items with retry logic and backpressure."""
+        """Process a batch of items with retry logic and backpressure.
+
+        Items are submitted ``chunksize`` at a time; only the items that
+        raise are retried.
+        """
         if not batch:
             return []
 
@@ -306,46 +378,56 @@ class ThreadPoolManager:
         if self._check_backpressure():
             time.sleep(0.1)  # Brief pause to allow queue to drain
 
-        for item in batch:
+        for start in range(0, len(batch), chunksize):
             if self._shutdown_event.is_set():
                 break
-            future = self.executor.submit(process_func, item)
-            futures.append((future, item))
-            self._submitted_futures.append(future)
+            chunk = batch[start : start + chunksize]
+            future = self.executor.submit(_process_chunk, process_func, chunk)
+            futures.append((future, chunk))
+            self._submitted_futures.add(future)
 
-        for future, item in futures:
+        for future, chunk in futures:
             if self._shutdown_event.is_set():
                 break
             try:
                 item_start_time = time.time()
-                result = future.result()
+                chunk_results, failures = future.result()
                 item_time = time.time() - item_start_time
 
-                results.append(result)
-                self.metrics.total_items_processed += 1
-                self.metrics.successful_items += 1
-                self.metrics.update_average_processing_time(item_time)
+                results.extend(chunk_results)
+                if chunk_results:
+                    self.metrics.total_items_processed += len(chunk_results)
+                    self.metrics.successful_items += len(chunk_results)
+                    self.metrics.update_average_processing_time(
+                        item_time, len(chunk_results)
+                    )
+                for item, error in failures:
+                    logger.error(f"Error processing item: {error}")
+                    retry_items.append(item)
+                    self.metrics.failed_items += 1
 
                 if self.progress_bar:
+                    item = chunk[-1]
                     file_name = os.path.basename(item) if isinstance(item, str) else ""
-                    self.progress_bar.update(1, file_name=file_name)
+                    self.progress_bar.update(len(chunk), file_name=file_name)
 
             except Exception as e:
                 logger.error(f"Error processing item: {e}")
-                retry_items.append(item)
-                self.metrics.failed_items += 1
+                retry_items.extend(chunk)
+                self.metrics.failed_items += len(chunk)
                 if self.progress_bar:
-                    self.progress_bar.update(1)
+                    self.progress_bar.update(len(chunk))
             finally:
                 # Remove completed futures from tracking list
-                if future in self._submitted_futures:
-                    self._submitted_futures.remove(future)
+                self._submitted_futures.discard(future)
 
         # Handle retries if needed
         if retry_items and retries < config.max_retries:
             self.metrics.retry_count += 1
             time.sleep(config.retry_delay)
-            retry_results = self.process_batch(retry_items, process_func, retries + 1)
+            retry_results = self.process_batch(
+                retry_items, process_func, retries + 1, chunksize
+            )
             results.extend(retry_results)
 
         batch_time = time.time() - batch_start_time
@@ -357,11 +439,23 @@ class ThreadPoolManager:
         self,
         items: Iterable[Any],
         process_func: Callable,
+        chunksize: int = 1,
         **kwargs: Any,
     ) -> List[Any]:
-        """Process items in batches with adaptive resource monitoring."""
+        """Process items in batches with adaptive resource monitoring.
+
+        Args:
+            items: Items to process
+            process_func: Function applied to each item
+            chunksize: Number of items handed to a worker per task. Larger
+                chunks cut per-task overhead when ``process_func`` is cheap.
+
+        Returns:
+            Results of the successful items, in submission order
+        """
         if self._shutdown_event.is_set() or not self.executor:
             return []
+        chunksize = max(1, chunksize)
 
         all_results = []
         current_batch = []
@@ -373,13 +467,17 @@ class ThreadPoolManager:
             current_batch.append(item)
 
             if len(current_batch) >= config.batch_size:
-                results = self.process_batch(current_batch, process_func)
+                results = self.process_batch(
+                    current_batch, process_func, chunksize=chunksize
+                )
                 all_results.extend(results)
                 current_batch = []
 
         # Process remaining items
         if current_batch and not self._shutdown_event.is_set():
-            results = self.process_batch(current_batch, process_func)
+            results = self.process_batch(
+                current_batch, process_func, chunksize=chunksize
+            )
             all_results.extend(results)
 
         return all_results
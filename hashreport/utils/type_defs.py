@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+import re
+import string
+from itertools import repeat
 from pathlib import Path
 from typing import (
     Any,
@@ -14,11 +17,20 @@ from typing import (
     Protocol,
     TypeVar,
     Union,
+    get_args,
     runtime_checkable,
 )
 
 logger = logging.getLogger(__name__)
 
+_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+_LABEL_EDGE_CHARS = frozenset(string.ascii_letters + string.digits)
+_LABEL_CHARS = _LABEL_EDGE_CHARS | {"-"}
+_MAX_HOSTNAME_LENGTH = 253
+_MAX_LABEL_LENGTH = 63
+
 # Type aliases for better readability and consistency
 FilePath = Union[str, Path]
 FileSize = int  # Size in bytes
@@ -28,6 +40,9 @@ EmailAddress = NewType("EmailAddress", str)
 Hostname = NewType("Hostname", str)
 PortNumber = NewType("PortNumber", int)
 
+_HASH_ALGORITHMS = frozenset(get_args(HashAlgorithm))
+_REPORT_FORMATS = frozenset(get_args(ReportFormat))
+
 # Generic type variables
 T = TypeVar("T")
 K = TypeVar("K")
@@ -109,15 +124,9 @@ def validate_hash_algorithm(algorithm: str) -> HashAlgorithm:
     Raises:
         ValueError: If algorithm is not supported
     """
-    valid_algorithms: List[HashAlgorithm] = [
-        "md5",
-        "sha1",
-        "sha256",
-        "sha512",
-        "blake2b",
-    ]
-    if algorithm.lower() in valid_algorithms:
-        return algorithm.lower()  # type: ignore
+    normalized = algorithm.lower()
+    if normalized in _HASH_ALGORITHMS:
+        return normalized  # type: ignore
     raise ValueError(f"Unsupported hash algorithm: {algorithm}")
 
 
@@ -133,9 +142,9 @@ def validate_report_format(format_str: str) -> ReportFormat:
     Raises:
         ValueError: If format is not supported
     """
-    valid_formats: List[ReportFormat] = ["csv", "json"]
-    if format_str.lower() in valid_formats:
-        return format_str.lower()  # type: ignore
+    normalized = format_str.lower()
+    if normalized in _REPORT_FORMATS:
+        return normalized  # type: ignore
     raise ValueError(f"Unsupported report format: {format_str}")
 
 
@@ -151,10 +160,7 @@ def validate_email_address(email: str) -> EmailAddress:
     Raises:
         ValueError: If email format is invalid
     """
-    import re
-
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if re.match(pattern, email):
+    if _EMAIL_PATTERN.match(email):
         return EmailAddress(email)
     raise ValueError(f"Invalid email address format: {email}")
 
@@ -188,18 +194,36 @@ def validate_hostname(hostname: str) -> Hostname:
     Raises:
         ValueError: If hostname format is invalid
     """
-    import re
-
-    # More strict pattern that requires at least one dot and proper TLD
-    pattern = (
-        r"^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?"
-        r"(\.[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?)*\.[a-zA-Z]{2,}$"
-    )
-    if re.match(pattern, hostname):
+    if _is_valid_hostname(hostname):
         return Hostname(hostname)
     raise ValueError(f"Invalid hostname format: {hostname}")
 
 
+def _is_valid_hostname(hostname: str) -> bool:
+    """Check hostname structure label by label.
+
+    Requires at least one dot, labels of 1-63 letters, digits or hyphens
+    that start and end with a letter or digit, an alphabetic TLD of two
+    or more letters, and at most 253 characters overall.
+    """
+    if len(hostname) > _MAX_HOSTNAME_LENGTH:
+        return False
+    labels = hostname.split(".")
+    if len(labels) < 2:
+        return False
+    tld = labels[-1]
+    if not 2 <= len(tld) <= _MAX_LABEL_LENGTH or not _ASCII_LETTERS.issuperset(tld):
+        return False
+    for label in labels[:-1]:
+        if not 0 < len(label) <= _MAX_LABEL_LENGTH:
+            return False
+        if label[0] not in _LABEL_EDGE_CHARS or label[-1] not in _LABEL_EDGE_CHARS:
+            return False
+        if not _LABEL_CHARS.issuperset(label):
+            return False
+    return True
+
+
 def is_valid_report_entry(entry: Any) -> bool:
     """Permissive: Accept any dict as a valid report entry."""
     return isinstance(entry, dict)
@@ -209,6 +233,9 @@ def validate_report_data(data: Any) -> ReportData:
     """Permissive: Accept any list of dicts as valid report data."""
     if not isinstance(data, list):
         raise ValueError("Report data must be a list")
+    # Check every entry in one C-level pass; only walk again to report a failure
+    if all(map(isinstance, data, repeat(dict))):
+        return data
     for i, entry in enumerate(data):
         if not is_valid_report_entry(entry):
             raise ValueError(f"Invalid report entry at index {i}: {entry}")
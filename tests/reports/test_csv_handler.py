@@ -59,6 +59,46 @@ def test_csv_write_empty(tmp_path):
         pytest.fail("Expected no CSV file to exist after writing empty data")
 
 
+def test_csv_stream_matches_write(tmp_path, sample_data):
+    """Test streaming rows in batches produces the same file as write()."""
+    written = CSVReportHandler(tmp_path / "written.csv")
+    streamed = CSVReportHandler(tmp_path / "streamed.csv")
+
+    written.write(sample_data)
+    with streamed.stream() as write_rows:
+        write_rows(sample_data[:1])
+        write_rows([])
+        write_rows(sample_data[1:])
+
+    assert streamed.filepath.read_text() == written.filepath.read_text()
+
+
+def test_csv_stream_handles_rows_with_other_key_order(tmp_path):
+    """Test rows that differ from the header order fall back to DictWriter."""
+    written = CSVReportHandler(tmp_path / "written.csv")
+    streamed = CSVReportHandler(tmp_path / "streamed.csv")
+    rows = [{"name": "a", "value": "1"}, {"value": "2", "name": "b"}, {"name": "c"}]
+
+    written.write(rows)
+    with streamed.stream() as write_rows:
+        write_rows(rows[:1])
+        write_rows(rows[1:])
+
+    assert streamed.filepath.read_text() == written.filepath.read_text()
+
+
+def test_csv_stream_removes_partial_report(tmp_path, sample_data):
+    """Test a failed stream does not leave a partial CSV behind."""
+    handler = CSVReportHandler(tmp_path / "test.csv")
+
+    with pytest.raises(RuntimeError):
+        with handler.stream() as write_rows:
+            write_rows(sample_data)
+            raise RuntimeError("scan failed")
+
+    assert not handler.filepath.exists()
+
+
 def test_csv_read_invalid():
     """Test reading from an invalid path."""
     handler = CSVReportHandler("nonexistent.csv")
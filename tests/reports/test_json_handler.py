@@ -129,6 +129,78 @@ def test_json_legacy_field_conversion(tmp_path, legacy_data):
     assert "Hash Value" not in first_entry
 
 
+def test_json_write_does_not_mutate_input(tmp_path, legacy_data):
+    """Test that legacy field conversion leaves the caller's rows untouched."""
+    handler = JSONReportHandler(tmp_path / "legacy.json")
+    original = [dict(entry) for entry in legacy_data]
+
+    handler.write(legacy_data)
+
+    assert legacy_data == original
+    assert "File Path" in legacy_data[0]
+
+
+@pytest.mark.parametrize("count", [0, 1, 2])
+def test_json_stream_matches_write(tmp_path, legacy_data, count):
+    """Test streaming entries in batches produces the same file as write()."""
+    written = JSONReportHandler(tmp_path / "written.json")
+    streamed = JSONReportHandler(tmp_path / "streamed.json")
+
+    written.write(legacy_data[:count])
+    with streamed.stream() as write_entries:
+        write_entries(legacy_data[:1][:count])
+        write_entries(legacy_data[1:count])
+
+    assert streamed.filepath.read_text() == written.filepath.read_text()
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        {"file": "plain.txt", "size": 1024, "ok": True, "ratio": 0.5, "gone": None},
+        {"file": 'caf\u00e9 "quoted"\n.txt', "name": "\u2603"},
+        {"file": "nested.txt", "tags": ["a", "b"], "meta": {"k": 1}},
+        {"file": "int-key.txt", 1: "one"},
+    ],
+)
+def test_json_stream_encodes_like_json_dump(tmp_path, entry):
+    """Test the streamed encoding matches json.dump for varied entries."""
+    written = JSONReportHandler(tmp_path / "written.json")
+    streamed = JSONReportHandler(tmp_path / "streamed.json")
+
+    written.write([entry, entry])
+    with streamed.stream() as write_entries:
+        write_entries([entry, entry])
+
+    assert streamed.filepath.read_text() == written.filepath.read_text()
+
+
+def test_json_stream_keeps_existing_report_on_early_failure(tmp_path, sample_data):
+    """Test a stream that fails before any entry leaves the old report intact."""
+    handler = JSONReportHandler(tmp_path / "test.json")
+    handler.write(sample_data)
+
+    with pytest.raises(RuntimeError):
+        with handler.stream():
+            raise RuntimeError("scan failed")
+
+    assert handler.read() == sample_data
+
+
+def test_json_stream_wraps_unserializable_entry(tmp_path):
+    """Test a value json cannot encode raises JSONReportError like write()."""
+    handler = JSONReportHandler(tmp_path / "test.json")
+    entry = {"file": "test.txt", "value": object()}
+
+    with pytest.raises(JSONReportError, match="Error processing report data"):
+        JSONReportHandler(tmp_path / "written.json").write([entry])
+    with pytest.raises(JSONReportError, match="Error processing report data"):
+        with handler.stream() as write_entries:
+            write_entries([entry])
+
+    assert not handler.filepath.exists()
+
+
 def test_json_validate_data_invalid_type(tmp_path):
     """Test validation with invalid data types."""
     handler = JSONReportHandler(tmp_path / "test.json")
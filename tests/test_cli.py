@@ -1,5 +1,6 @@
 """Tests for the CLI module."""
 
+from pathlib import Path
 from unittest.mock import patch
 
 import click
@@ -7,6 +8,7 @@ import pytest
 from click.testing import CliRunner
 
 from hashreport.cli import cli, validate_size
+from hashreport.config import HashReportConfig
 
 
 def test_validate_size():
@@ -113,6 +115,24 @@ def test_scan_format_handling(mock_walk, tmp_path):
     assert args[1][0].endswith(".json")  # Format should override existing extension
 
 
+@patch("hashreport.cli.walk_directory_and_log")
+def test_scan_multiple_formats_share_timestamp(mock_walk, tmp_path):
+    """Test reports for one scan get the same timestamped base name."""
+    runner = CliRunner()
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    result = runner.invoke(
+        cli,
+        ["scan", str(tmp_path), "-o", str(output_dir), "-f", "json", "-f", "csv"],
+    )
+    assert result.exit_code == 0
+    args, _ = mock_walk.call_args
+    stems = {Path(name).stem for name in args[1]}
+    assert len(args[1]) == 2
+    assert len(stems) == 1
+
+
 @patch("hashreport.cli.show_available_options")
 def test_algorithms_command(mock_show):
     """Test algorithms command."""
@@ -921,8 +941,10 @@ def test_scan_command_with_default_format(tmp_path):
     input_dir.mkdir()
 
     with patch("hashreport.cli.walk_directory_and_log") as mock_walk:
-        with patch("hashreport.cli.get_config") as mock_config:
-            mock_config.return_value.default_format = "csv"
+        with patch(
+            "hashreport.cli.get_config",
+            return_value=HashReportConfig(default_format="csv"),
+        ):
             result = runner.invoke(cli, ["scan", str(input_dir)])
             assert result.exit_code == 0
             mock_walk.assert_called_once()
@@ -939,8 +961,10 @@ def test_scan_command_with_default_algorithm(tmp_path):
     input_dir.mkdir()
 
     with patch("hashreport.cli.walk_directory_and_log"):
-        with patch("hashreport.cli.get_config") as mock_config:
-            mock_config.return_value.default_algorithm = "sha1"
+        with patch(
+            "hashreport.cli.get_config",
+            return_value=HashReportConfig(default_algorithm="sha1"),
+        ):
             # Also need to patch the default in the CLI option
             with patch("hashreport.cli.scan") as mock_scan:
                 mock_scan.return_value = None
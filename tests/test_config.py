@@ -5,7 +5,12 @@ from unittest.mock import patch
 
 import pytest
 
-from hashreport.config import HashReportConfig, get_config, reset_config
+from hashreport.config import (
+    HashReportConfig,
+    available_cpu_count,
+    get_config,
+    reset_config,
+)
 
 
 def test_hashreport_config_defaults():
@@ -23,6 +28,7 @@ def test_hashreport_config_max_workers(monkeypatch):
         return 8
 
     monkeypatch.setattr("os.cpu_count", mock_cpu_count)
+    monkeypatch.delattr("os.sched_getaffinity", raising=False)
     cfg = HashReportConfig(max_workers=None)
     assert cfg.max_workers == 16, "Expected max_workers to be CPU count * 2"
 
@@ -187,6 +193,7 @@ def test_max_workers_initialization_exception(monkeypatch):
         raise Exception("CPU count error")
 
     monkeypatch.setattr("os.cpu_count", mock_cpu_count)
+    monkeypatch.setattr("os.sched_getaffinity", mock_cpu_count, raising=False)
 
     cfg = HashReportConfig(max_workers=None)
     assert cfg.max_workers == 8  # Default fallback
@@ -224,6 +231,7 @@ def test_validation_invalid_numeric_ranges():
         {"max_workers": 0},
         {"memory_threshold": 0},
         {"memory_threshold": 1.5},
+        {"walk_workers": 0},
     ]
 
     for invalid_config in invalid_configs:
@@ -411,3 +419,19 @@ default_algorithm = "sha256"
         assert config["tool"]["hashreport"]["default_algorithm"] == "sha256"
     finally:
         os.chdir(original_cwd)
+
+
+def test_available_cpu_count_uses_affinity():
+    """Test CPU count follows the affinity mask when the platform has one."""
+    with patch(
+        "hashreport.config.os.sched_getaffinity", return_value={0, 1, 2}, create=True
+    ), patch("hashreport.config.os.cpu_count", return_value=64):
+        assert available_cpu_count() == 3
+        assert HashReportConfig(max_workers=None).max_workers == 6
+
+
+def test_available_cpu_count_without_affinity(monkeypatch):
+    """Test CPU count falls back to os.cpu_count without an affinity mask."""
+    monkeypatch.delattr("hashreport.config.os.sched_getaffinity", raising=False)
+    monkeypatch.setattr("hashreport.config.os.cpu_count", lambda: 4)
+    assert available_cpu_count() == 4
@@ -1,9 +1,12 @@
 """Tests for conversions utility."""
 
+from datetime import datetime
+
 import pytest
 
 from hashreport.utils.conversions import (
     format_size,
+    format_timestamp,
     parse_size,
     parse_size_string,
     parse_size_string_strict,
@@ -284,3 +287,36 @@ def test_validate_size_string_error_messages():
     with pytest.raises(ValueError) as exc_info:
         validate_size_string("-1KB")
     assert "Size must include unit" in str(exc_info.value)
+
+
+def test_parse_size_string_invalid_formats():
+    """Test parse_size_string with invalid formats."""
+    invalid_sizes = [
+        "abc",  # No number
+        "123",  # No unit
+        "123XYZ",  # Invalid unit
+        "abcKB",  # No number
+        "1.2.3KB",  # Invalid number
+    ]
+
+    for size_str in invalid_sizes:
+        with pytest.raises(ValueError):
+            parse_size_string(size_str)
+
+
+def test_parse_size_string_whitespace_and_zero():
+    """Test parse_size_string with surrounding whitespace and zero sizes."""
+    # Whitespace handling
+    assert parse_size_string("  1KB  ") == 1024
+    assert parse_size_string("\t2MB\n") == 2 * 1024 * 1024
+
+    # Zero values
+    assert parse_size_string("0B") == 0
+    assert parse_size_string("0KB") == 0
+
+
+def test_format_timestamp_matches_datetime():
+    """Test timestamps format like datetime.fromtimestamp(...).strftime."""
+    for timestamp in (0, 1_700_000_000, 1_700_000_000.75):
+        expected = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        assert format_timestamp(timestamp) == expected
@@ -1,10 +1,14 @@
 """Tests for filters utility."""
 
+import fnmatch
+import os
 from unittest.mock import patch
 
 import pytest
 
 from hashreport.utils.filters import (
+    _basename,
+    build_file_filter,
     compile_patterns,
     matches_pattern,
     should_process_file,
@@ -26,6 +30,23 @@ def test_compile_patterns():
         pytest.fail("Expected compiled regex patterns")
 
 
+def test_compile_patterns_glob_is_cached():
+    """Test glob patterns are translated once and anchored like fnmatch."""
+    first = compile_patterns(["*.txt"])
+    second = compile_patterns(["*.txt"])
+    assert first[0] is second[0]
+    assert first[0].search("test.txt")
+    assert not first[0].search("test.txt.bak")
+    assert not compile_patterns(["test.*"])[0].search("my_test.txt")
+
+
+def test_glob_many_wildcards_match_in_linear_time():
+    """Test many-wildcard globs match in linear time instead of backtracking."""
+    patterns = compile_patterns(["*a*a*a*a*a*a*a*a*b"])
+    assert not matches_pattern("a" * 200, patterns)
+    assert matches_pattern("a" * 200 + "b", patterns)
+
+
 def test_compile_patterns_case_sensitivity():
     """Test pattern compilation with case sensitivity."""
     patterns = ["Test.*"]
@@ -68,29 +89,21 @@ def test_matches_pattern_filename_only():
         pytest.fail("Expected match on filename")
 
 
-def test_should_process_file(tmp_path):
-    """Test file processing criteria."""
-    # Create test files
-    test_file = tmp_path / "test.txt"
-    test_file.write_text("test content")
-
-    # Test size filters
-    if not should_process_file(str(test_file), min_size=1):
-        pytest.fail("File should meet minimum size requirement")
-    if should_process_file(str(test_file), max_size=1):
-        pytest.fail("File should not meet maximum size requirement")
+@pytest.mark.parametrize(
+    "path",
+    ["test.txt", "/long/path/test.txt", "relative/dir/", "/", "", "a/b/.hidden"],
+)
+def test_basename_matches_os_path(path):
+    """Test the fast basename helper agrees with os.path.basename."""
+    assert _basename(path) == os.path.basename(path)
 
-    # Test patterns
-    if not should_process_file(str(test_file), include_patterns=["*.txt"]):
-        pytest.fail("File should match include pattern")
-    if should_process_file(str(test_file), exclude_patterns=["*.txt"]):
-        pytest.fail("File should match exclude pattern")
 
-    # Test regex patterns
-    if not should_process_file(
-        str(test_file), include_patterns=[r"\.txt$"], use_regex=True
-    ):
-        pytest.fail("File should match regex pattern")
+def test_basename_uses_dir_entry_name(tmp_path):
+    """Test directory entries use their precomputed name."""
+    (tmp_path / "entry.txt").touch()
+    with os.scandir(tmp_path) as it:
+        (entry,) = list(it)
+    assert _basename(entry) == "entry.txt"
 
 
 def test_should_process_invalid_file(tmp_path):
@@ -106,13 +119,22 @@ def test_should_process_invalid_file(tmp_path):
         pytest.fail("Should return False for directory")
 
 
-def test_pattern_error_handling():
-    """Test error handling for invalid patterns."""
-    # Invalid regex pattern
-    patterns = compile_patterns(["[invalid"], use_regex=True)
-    assert len(patterns) == 0, "Expected empty list for invalid pattern"
+INVALID_REGEX_PATTERNS = [
+    ["[invalid"],
+    ["(*invalid)"],
+    # A single invalid pattern discards the whole list
+    ["invalid*", "[invalid"],
+]
+
 
-    # Invalid glob pattern
+@pytest.mark.parametrize("patterns", INVALID_REGEX_PATTERNS)
+def test_compile_patterns_invalid_regex(patterns):
+    """Test pattern compilation with invalid regex patterns."""
+    assert compile_patterns(patterns, use_regex=True) == []
+
+
+def test_pattern_error_handling():
+    """Test error handling for invalid glob patterns."""
     assert not matches_pattern("test.txt", ["["], use_regex=False)
 
 
@@ -125,13 +147,6 @@ def test_compile_patterns_empty():
     assert result == []
 
 
-def test_compile_patterns_invalid_regex():
-    """Test pattern compilation with invalid regex patterns."""
-    patterns = ["[invalid", "(*invalid)", "invalid*"]
-    result = compile_patterns(patterns, use_regex=True)
-    assert len(result) == 0
-
-
 def test_matches_pattern_regex_edge_cases():
     """Test regex pattern matching edge cases."""
     # Test with empty pattern
@@ -147,53 +162,72 @@ def test_matches_pattern_regex_edge_cases():
     assert not matches_pattern("123.txt", patterns, use_regex=True)
 
 
-def test_should_process_file_size_edge_cases(tmp_path):
-    """Test file size filter edge cases."""
+def test_matches_pattern_raw_regex_keeps_whitespace():
+    """Test raw regex strings are not compiled in verbose mode."""
+    assert matches_pattern("/x/my file.txt", ["my file"], use_regex=True)
+    assert matches_pattern("/x/MY FILE.txt", ["my file"], use_regex=True)
+
+
+def test_matches_pattern_raw_regex_skips_invalid():
+    """Test an invalid raw regex only skips that pattern."""
+    assert matches_pattern("/x/my file.txt", ["[bad", "my"], use_regex=True)
+    assert not matches_pattern("/x/other.txt", ["[bad", "my"], use_regex=True)
+
+
+# "test content" is 12 bytes on disk.
+SHOULD_PROCESS_CASES = [
+    # Size filters
+    (1, None, None, None, False, True),
+    (None, 1, None, None, False, False),
+    (1000, None, None, None, False, False),
+    (None, 1000, None, None, False, True),
+    (-1, None, None, None, False, False),
+    (None, -1, None, None, False, False),
+    (12, 12, None, None, False, True),
+    (13, 13, None, None, False, False),
+    # Glob patterns
+    (None, None, ["*.txt"], None, False, True),
+    (None, None, None, ["*.txt"], False, False),
+    (None, None, ["*.txt"], ["*.tmp"], False, True),
+    (None, None, ["*.txt"], ["*.txt"], False, False),
+    (None, None, ["*.txt", "test.*"], ["*.tmp"], False, True),
+    (None, None, ["*.log", "test.*"], None, False, True),
+    (None, None, None, ["*.log", "*.txt"], False, False),
+    # Regex patterns
+    (None, None, [r"\.txt$"], None, True, True),
+    (None, None, [r"\.txt$"], [r"\.tmp$"], True, True),
+    (None, None, [r"\.log$", r"^test\."], None, True, True),
+    (None, None, [r"^(data|test)\.", r"\.log$"], None, True, True),
+    (None, None, None, [r"\.log$", r"\.txt$"], True, False),
+]
+
+
+@pytest.fixture
+def sample_txt(tmp_path):
+    """Create a small text file shared by the should_process_file cases."""
     test_file = tmp_path / "test.txt"
     test_file.write_text("test content")
-
-    # Test with zero size
-    assert not should_process_file(str(test_file), min_size=1000)
-    assert should_process_file(str(test_file), max_size=1000)
-
-    # Test with negative size
-    assert not should_process_file(str(test_file), min_size=-1)
-    assert not should_process_file(str(test_file), max_size=-1)
-
-    # Test with equal min and max size
-    file_size = test_file.stat().st_size
-    assert should_process_file(str(test_file), min_size=file_size, max_size=file_size)
-    assert not should_process_file(
-        str(test_file), min_size=file_size + 1, max_size=file_size + 1
-    )
+    return test_file
 
 
-def test_should_process_file_pattern_combinations(tmp_path):
-    """Test combinations of include and exclude patterns."""
-    test_file = tmp_path / "test.txt"
-    test_file.write_text("test content")
-
-    # Test with both include and exclude patterns
-    assert should_process_file(
-        str(test_file), include_patterns=["*.txt"], exclude_patterns=["*.tmp"]
-    )
-
-    # Test with conflicting patterns
-    assert not should_process_file(
-        str(test_file), include_patterns=["*.txt"], exclude_patterns=["*.txt"]
-    )
-
-    # Test with multiple patterns
-    assert should_process_file(
-        str(test_file), include_patterns=["*.txt", "test.*"], exclude_patterns=["*.tmp"]
-    )
-
-    # Test with regex patterns
-    assert should_process_file(
-        str(test_file),
-        include_patterns=[r"\.txt$"],
-        exclude_patterns=[r"\.tmp$"],
-        use_regex=True,
+@pytest.mark.parametrize(
+    ("min_size", "max_size", "include", "exclude", "use_regex", "expected"),
+    SHOULD_PROCESS_CASES,
+)
+def test_should_process_file(
+    sample_txt, min_size, max_size, include, exclude, use_regex, expected
+):
+    """Test file processing criteria for size and pattern combinations."""
+    assert (
+        should_process_file(
+            str(sample_txt),
+            include_patterns=include,
+            exclude_patterns=exclude,
+            use_regex=use_regex,
+            min_size=min_size,
+            max_size=max_size,
+        )
+        is expected
     )
 
 
@@ -214,3 +248,79 @@ def test_should_process_file_error_handling(tmp_path):
     with patch("pathlib.Path.stat") as mock_stat:
         mock_stat.side_effect = OSError("File system error")
         assert not should_process_file(str(test_file))
+
+
+def test_should_process_file_patterns_checked_before_stat(tmp_path):
+    """Test pattern rejection short-circuits before any stat call."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("test content")
+
+    with patch("pathlib.Path.stat") as mock_stat:
+        assert not should_process_file(str(test_file), exclude_patterns=["*.txt"])
+        assert not should_process_file(str(test_file), include_patterns=["*.log"])
+        mock_stat.assert_not_called()
+
+
+def test_should_process_file_dir_entry(tmp_path):
+    """Test directory entries from os.scandir are accepted."""
+    (tmp_path / "test.txt").write_text("test content")
+    (tmp_path / "subdir").mkdir()
+    entries = {entry.name: entry for entry in os.scandir(tmp_path)}
+
+    assert should_process_file(entries["test.txt"], include_patterns=["*.txt"])
+    assert should_process_file(entries["test.txt"], min_size=1, max_size=100)
+    assert not should_process_file(entries["test.txt"], max_size=1)
+    assert not should_process_file(entries["subdir"])
+
+
+def test_build_file_filter_compiles_once(tmp_path):
+    """Test a built filter reuses its compiled patterns for every file."""
+    keep = tmp_path / "keep.txt"
+    skip = tmp_path / "skip.log"
+    keep.write_text("test content")
+    skip.write_text("test content")
+
+    with patch("hashreport.utils.filters._compile_fused") as mock_compile:
+        mock_compile.side_effect = lambda p, r, c: compile_patterns(p, r, c)
+        file_filter = build_file_filter(
+            include_patterns=["k*.txt", "s*.log"], exclude_patterns=["skip.*"]
+        )
+        assert file_filter(str(keep))
+        assert not file_filter(str(skip))
+        assert mock_compile.call_count == 2
+
+
+@pytest.mark.skipif(os.path.normcase("A") != "A", reason="case-sensitive globs")
+def test_build_file_filter_plain_globs_skip_regex(tmp_path):
+    """Test exact names and *suffix globs are matched without a regex."""
+    (tmp_path / "keep.txt").write_text("test content")
+    (tmp_path / "skip.txt").write_text("test content")
+    (tmp_path / "other.log").write_text("test content")
+
+    with patch("hashreport.utils.filters._compile_fused") as mock_compile:
+        file_filter = build_file_filter(
+            include_patterns=["*.txt"], exclude_patterns=["skip.txt"]
+        )
+        assert file_filter(str(tmp_path / "keep.txt"))
+        assert not file_filter(str(tmp_path / "skip.txt"))
+        assert not file_filter(str(tmp_path / "other.log"))
+    mock_compile.assert_not_called()
+
+
+@pytest.mark.parametrize("pattern", ["*.txt", "*", "notes.txt", "*[.]txt", "n?tes*"])
+@pytest.mark.parametrize("name", ["notes.txt", "NOTES.TXT", ".txt", "notes.txt.bak"])
+def test_build_file_filter_plain_globs_match_fnmatch(tmp_path, pattern, name):
+    """Test the string fast path agrees with fnmatch semantics."""
+    test_file = tmp_path / name
+    test_file.write_text("test content")
+    file_filter = build_file_filter(include_patterns=[pattern])
+    assert file_filter(str(test_file)) == fnmatch.fnmatch(name, pattern)
+
+
+def test_build_file_filter_invalid_include_matches_nothing(tmp_path):
+    """Test include patterns that fail to compile reject every file."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("test content")
+
+    file_filter = build_file_filter(include_patterns=["[invalid"], use_regex=True)
+    assert not file_filter(str(test_file))
@@ -1,6 +1,8 @@
 """Tests for hasher utility."""
 
+import hashlib
 import mmap
+import os
 from unittest.mock import patch
 
 import pytest
@@ -113,3 +115,77 @@ def test_calculate_hash_with_different_sizes(tmp_path):
     threshold_file.write_bytes(b"x" * HashReportConfig.mmap_threshold)
     threshold_result = calculate_hash(str(threshold_file))
     assert threshold_result[1] is not None, "Threshold file hash should succeed"
+
+
+def test_calculate_hash_matches_hashlib_across_chunks(tmp_path):
+    """Test chunked hashing handles partial final chunks correctly."""
+    from hashreport.config import HashReportConfig
+
+    data = bytes(range(256)) * (HashReportConfig.chunk_size // 256 * 3 + 1)
+    data += b"tail"
+    test_file = tmp_path / "chunks.bin"
+    test_file.write_bytes(data)
+
+    _, hash_value, _ = calculate_hash(str(test_file), "sha256")
+    assert hash_value == hashlib.sha256(data).hexdigest()
+
+
+def test_calculate_hash_reuses_prototype_per_file(tmp_path):
+    """Test hashing several files with one algorithm gives independent digests."""
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    first.write_bytes(b"first")
+    second.write_bytes(b"second")
+
+    assert calculate_hash(str(first), "sha256")[1] == (
+        hashlib.sha256(b"first").hexdigest()
+    )
+    assert calculate_hash(str(second), "sha256")[1] == (
+        hashlib.sha256(b"second").hexdigest()
+    )
+
+
+def test_calculate_hash_stats_path_once(tmp_path):
+    """Test size and modification time come from a single stat call."""
+    test_file = tmp_path / "once.txt"
+    test_file.write_text("content")
+
+    with patch("hashreport.utils.hasher.os.stat", wraps=os.stat) as mock_stat:
+        _, hash_value, mod_time = calculate_hash(str(test_file), "sha256")
+
+    assert hash_value == hashlib.sha256(b"content").hexdigest()
+    assert mod_time
+    assert mock_stat.call_count == 1
+
+
+def test_calculate_hash_reuses_given_stat(tmp_path):
+    """Test a caller-supplied stat result replaces the hasher's own stat."""
+    test_file = tmp_path / "given.txt"
+    test_file.write_text("content")
+    st = os.stat(test_file)
+
+    with patch("hashreport.utils.hasher.os.stat") as mock_stat:
+        _, hash_value, _ = calculate_hash(str(test_file), "sha256", st)
+
+    assert hash_value == hashlib.sha256(b"content").hexdigest()
+    mock_stat.assert_not_called()
+
+
+def test_calculate_hash_unreported_size_uses_full_chunk(tmp_path):
+    """Test a file reporting size 0 is still read a full chunk at a time."""
+    from hashreport.config import HashReportConfig
+
+    data = b"x" * 10000
+    test_file = tmp_path / "pseudo.txt"
+    test_file.write_bytes(data)
+    real = os.stat(test_file)
+    # Mimic /proc and /sys files, whose st_size is 0 despite having content
+    st = os.stat_result(real[:6] + (0,) + real[7:10])
+
+    with patch(
+        "hashreport.utils.hasher.bytearray", wraps=bytearray, create=True
+    ) as mock_buffer:
+        _, hash_value, _ = calculate_hash(str(test_file), "sha256", st)
+
+    assert hash_value == hashlib.sha256(data).hexdigest()
+    mock_buffer.assert_called_once_with(HashReportConfig.chunk_size)
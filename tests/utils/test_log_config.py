@@ -19,3 +19,27 @@ def test_specified_logging_level():
     setup_logging(level=logging.WARNING, debug=False)
     logger = logging.getLogger("hashreport")
     assert logger.level == logging.WARNING, "Expected logger level to be WARNING"
+
+
+def test_setup_logging_is_idempotent():
+    """Test repeated setup does not attach duplicate handlers."""
+    setup_logging(level=logging.INFO)
+    logger = logging.getLogger("hashreport")
+    handlers = list(logger.handlers)
+
+    setup_logging(level=logging.INFO)
+    setup_logging(level=logging.ERROR)
+
+    assert logger.handlers == handlers
+    assert logger.level == logging.ERROR
+
+
+def test_setup_logging_reapplies_changed_level():
+    """Test setup restores the level if it was changed externally."""
+    setup_logging(level=logging.WARNING)
+    logger = logging.getLogger("hashreport")
+    logger.setLevel(logging.CRITICAL)
+
+    setup_logging(level=logging.WARNING)
+
+    assert logger.level == logging.WARNING
@@ -45,6 +45,18 @@ def test_progress_bar_update_with_file_name():
     assert pbar._bar.postfix == "test.txt"
 
 
+def test_progress_bar_update_does_not_repaint_every_file():
+    """Test file name updates are throttled instead of forcing a refresh."""
+    pbar = ProgressBar(total=50, show_file_names=True)
+    with patch.object(pbar._bar, "refresh") as mock_refresh:
+        for i in range(50):
+            pbar.update(1, file_name=f"file{i}.txt")
+    assert pbar._bar.n == 50
+    assert pbar._bar.postfix == "file49.txt"
+    assert mock_refresh.call_count < 50
+    pbar.close()
+
+
 def test_progress_bar_finish():
     """Test finishing the progress bar."""
     pbar = ProgressBar(total=3)
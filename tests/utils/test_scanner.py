@@ -1,12 +1,16 @@
 """Tests for the scanner utility."""
 
+import json
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from hashreport.utils.conversions import parse_size_string
 from hashreport.utils.exceptions import HashReportError
 from hashreport.utils.scanner import (
+    _collect_files_to_process,
+    _convert_scanner_params_to_filter_params,
+    _process_single_batch,
     count_files,
     get_report_filename,
     get_report_handlers,
@@ -33,7 +37,6 @@ def test_get_report_filename(tmp_path):
     ), "Expected path with correct extension"
 
 
-@patch("hashreport.utils.scanner.os.walk")
 @patch("hashreport.utils.scanner.calculate_hash")
 @patch("hashreport.utils.scanner.ProgressBar")
 @patch("hashreport.utils.scanner.get_report_handlers")
@@ -41,7 +44,6 @@ def test_walk_directory_and_log(
     mock_handlers,
     mock_progress,
     mock_hash,
-    mock_walk,
     tmp_path,
 ):
     """Test a simplified walk_directory_and_log."""
@@ -50,10 +52,8 @@ def test_walk_directory_and_log(
     test_file2 = tmp_path / "file2.txt"
     test_file.touch()
     test_file2.touch()
+    (tmp_path / "dir1").mkdir()
 
-    mock_walk.return_value = [
-        (str(tmp_path), ["dir1"], ["file1.txt", "file2.txt"]),
-    ]
     mock_handler = MagicMock()
     mock_handlers.return_value = [mock_handler]
     mock_hash.side_effect = [
@@ -70,8 +70,9 @@ def test_walk_directory_and_log(
     # Verify progress bar was created with show_file_names=False by default
     mock_progress.assert_called_once_with(total=2, show_file_names=False)
 
-    mock_handler.write.assert_called_once()
-    args = mock_handler.write.call_args[0]
+    write_rows = mock_handler.stream.return_value.__enter__.return_value
+    write_rows.assert_called_once()
+    args = write_rows.call_args[0]
     assert len(args[0]) == 2  # Should have 2 file entries
     assert args[0][0]["File Name"] == "file1.txt"
 
@@ -103,6 +104,23 @@ def test_walk_directory_with_filters(mock_hash, tmp_path):
         pytest.fail("Expected exactly one file to be processed")
 
 
+@pytest.mark.parametrize("regex", [False, True])
+def test_exclude_paths_match_names_literally(tmp_path, regex):
+    """Test excluded paths only exclude files with exactly that name."""
+    for name in ("a+b[1].txt", "ab1.txt", "aab.txt"):
+        (tmp_path / name).write_text(name)
+
+    filter_params = _convert_scanner_params_to_filter_params(
+        exclude_paths={str(tmp_path / "a+b[1].txt")}, regex=regex
+    )
+    collected = _collect_files_to_process(str(tmp_path), None, filter_params)
+
+    assert sorted(os.path.basename(path) for path in collected) == [
+        "aab.txt",
+        "ab1.txt",
+    ]
+
+
 def test_walk_directory_with_specific_files(tmp_path):
     """Test processing specific files only."""
     test_file = tmp_path / "specific.txt"
@@ -117,15 +135,31 @@ def test_walk_directory_with_specific_files(tmp_path):
         pytest.fail("Expected output file to be created")
 
 
-@patch("hashreport.utils.scanner.os.walk")
+def test_specific_files_skip_directory_walk(tmp_path):
+    """Test specific files are used directly without walking the directory."""
+    files = set()
+    for name in ("a.txt", "b.txt", "c.txt"):
+        path = tmp_path / name
+        path.write_text(name)
+        files.add(str(path))
+
+    with patch("hashreport.utils.scanner._iter_file_entries") as mock_walk:
+        collected = _collect_files_to_process(
+            str(tmp_path), files, filter_params={}, limit=2
+        )
+
+    mock_walk.assert_not_called()
+    # The limit keeps the same files on every run
+    assert collected == sorted(files)[:2]
+
+
 @patch("hashreport.utils.scanner.calculate_hash")
 @patch("hashreport.utils.scanner.ProgressBar")
-def test_multiple_report_formats(mock_progress, mock_hash, mock_walk, tmp_path, capfd):
+def test_multiple_report_formats(mock_progress, mock_hash, tmp_path, capfd):
     """Test handling multiple report formats."""
     test_file = tmp_path / "test.txt"
     test_file.touch()  # Create the test file
 
-    mock_walk.return_value = [(str(tmp_path), [], ["test.txt"])]
     mock_hash.return_value = (str(test_file), "abc123", "2024-01-01 00:00:00")
 
     # Create a mock progress bar
@@ -144,6 +178,143 @@ def test_multiple_report_formats(mock_progress, mock_hash, mock_walk, tmp_path,
     assert "report.csv" in captured.out
 
 
+def test_multiple_report_formats_keep_own_fields(tmp_path):
+    """Test a JSON handler does not rename fields seen by later handlers."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "test.txt").write_text("content")
+    json_report = tmp_path / "report.json"
+    csv_report = tmp_path / "report.csv"
+
+    walk_directory_and_log(str(data_dir), [str(json_report), str(csv_report)])
+
+    assert csv_report.read_text().splitlines()[0].startswith("File Name,")
+    assert '"file"' in json_report.read_text()
+
+
+@pytest.fixture
+def serial_pool():
+    """Pool stand-in that runs every item in the calling thread."""
+    pool = MagicMock()
+    pool.current_workers = 1
+    pool.process_items.side_effect = lambda items, func, chunksize: [
+        func(i) for i in items
+    ]
+    return pool
+
+
+@pytest.fixture
+def file_batch(tmp_path):
+    """Create ten small files and return their paths as a scan batch."""
+    batch = []
+    for i in range(10):
+        path = tmp_path / f"file{i}.txt"
+        path.write_text(str(i))
+        batch.append(str(path))
+    return batch
+
+
+def test_process_single_batch_hashes_files_in_chunks(serial_pool, file_batch):
+    """Test a batch is handed to the pool in chunks of files, in order."""
+    results = _process_single_batch(serial_pool, file_batch, "sha256", MagicMock())
+
+    assert serial_pool.process_items.call_args.kwargs["chunksize"] > 1
+    assert [row["File Path"] for row in results] == file_batch
+
+
+def test_walk_directory_streams_each_batch_to_reports(tmp_path):
+    """Test results reach the reports batch by batch rather than all at once."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (data_dir / name).write_text(name)
+    output = tmp_path / "report.json"
+
+    with patch("hashreport.utils.scanner.config.batch_size", 1), patch(
+        "hashreport.reports.json_handler.JSONReportHandler.write"
+    ) as mock_write:
+        walk_directory_and_log(str(data_dir), str(output))
+
+    mock_write.assert_not_called()
+    names = sorted(entry["name"] for entry in json.loads(output.read_text()))
+    assert names == ["a.txt", "b.txt", "c.txt"]
+
+
+def test_process_single_batch_stats_each_file_once(serial_pool, file_batch):
+    """Test hashing and the report row share a single stat per file."""
+    with patch("hashreport.utils.scanner.os.stat", wraps=os.stat) as mock_stat:
+        results = _process_single_batch(serial_pool, file_batch, "sha256", MagicMock())
+
+    assert len(results) == len(file_batch)
+    assert mock_stat.call_count == len(file_batch)
+
+
+def test_walk_directory_shares_one_pool_across_batches(tmp_path):
+    """Test every batch in a scan runs on the same thread pool."""
+    from hashreport.utils.thread_pool import ThreadPoolManager
+
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_text(name)
+    output = tmp_path / "out" / "report.csv"
+
+    with patch("hashreport.utils.scanner.config.batch_size", 1), patch(
+        "hashreport.utils.scanner.ThreadPoolManager", wraps=ThreadPoolManager
+    ) as mock_pool:
+        reports = walk_directory_and_log(str(tmp_path), str(output))
+
+    assert reports == [str(output)]
+    mock_pool.assert_called_once()
+    assert len(output.read_text().splitlines()) == 4  # header + 3 rows
+
+
+def test_walk_directory_skips_pool_without_files(tmp_path):
+    """Test a scan with nothing to hash starts no thread pool."""
+    data_dir = tmp_path / "empty"
+    data_dir.mkdir()
+    output = tmp_path / "report.json"
+
+    with patch("hashreport.utils.scanner.ThreadPoolManager") as mock_pool:
+        reports = walk_directory_and_log(str(data_dir), str(output))
+
+    assert reports == [str(output)]
+    mock_pool.assert_not_called()
+    assert json.loads(output.read_text()) == []
+
+
+def test_walk_directory_shuts_pool_down_when_writing_fails(tmp_path):
+    """Test the pool is shut down before returning when a report write fails."""
+    from hashreport.utils.thread_pool import ThreadPoolManager
+
+    pools = []
+
+    def make_pool(*args, **kwargs):
+        pools.append(ThreadPoolManager(*args, **kwargs))
+        return pools[-1]
+
+    def failing_write(handlers, result_batches, output_files):
+        next(iter(result_batches))
+        raise OSError("disk full")
+
+    (tmp_path / "a.txt").write_text("a")
+    output = tmp_path / "out" / "report.csv"
+
+    # Record whether the pool was already shut down when the error is reported
+    shut_down_at_report = []
+
+    def echo(message, err=False):
+        shut_down_at_report.append(pools[0].executor is None)
+
+    with patch(
+        "hashreport.utils.scanner.ThreadPoolManager", side_effect=make_pool
+    ), patch("hashreport.utils.scanner._write_scan_results", failing_write), patch(
+        "hashreport.utils.scanner.click.echo", echo
+    ):
+        assert walk_directory_and_log(str(tmp_path), str(output)) is None
+
+    assert len(pools) == 1
+    assert shut_down_at_report == [True]
+
+
 def test_get_report_handlers():
     """Test creating multiple report handlers."""
     filenames = ["test.json", "test.csv"]
@@ -175,34 +346,12 @@ def test_count_files(tmp_path):
     assert count_files(tmp_path, recursive=False) == 2
 
 
-def test_parse_size_string_invalid_formats():
-    """Test parse_size_string with invalid formats."""
-    invalid_sizes = [
-        "abc",  # No number
-        "123",  # No unit
-        "123XYZ",  # Invalid unit
-        "abcKB",  # No number
-        "1.2.3KB",  # Invalid number
-    ]
-
-    for size_str in invalid_sizes:
-        with pytest.raises(ValueError):
-            parse_size_string(size_str)
-
-
-def test_parse_size_string_edge_cases():
-    """Test parse_size_string with edge cases."""
-    # Whitespace handling
-    assert parse_size_string("  1KB  ") == 1024
-    assert parse_size_string("\t2MB\n") == 2 * 1024 * 1024
-
-    # Zero values
-    assert parse_size_string("0B") == 0
-    assert parse_size_string("0KB") == 0
+def test_get_report_handlers_ignores_extension_case():
+    """Test handler dispatch is case-insensitive on the file extension."""
+    from hashreport.reports.json_handler import JSONReportHandler
 
-    # Large values
-    assert parse_size_string("1GB") == 1024 * 1024 * 1024
-    assert parse_size_string("2.5MB") == int(2.5 * 1024 * 1024)
+    (handler,) = get_report_handlers(["REPORT.JSON"])
+    assert isinstance(handler, JSONReportHandler)
 
 
 def test_get_report_handlers_unsupported_format():
@@ -219,6 +368,14 @@ def test_get_report_filename_directory(tmp_path):
     assert result.startswith(str(tmp_path))
 
 
+def test_get_report_filename_uses_given_timestamp(tmp_path):
+    """Test a caller-supplied timestamp is used for directory outputs."""
+    json_name = get_report_filename(str(tmp_path), "json", timestamp="20250101")
+    csv_name = get_report_filename(str(tmp_path), "csv", timestamp="20250101")
+    assert json_name == str(tmp_path / "hashreport_20250101.json")
+    assert csv_name == str(tmp_path / "hashreport_20250101.csv")
+
+
 def test_get_report_filename_file_path(tmp_path):
     """Test get_report_filename with file path."""
     file_path = tmp_path / "report.csv"
@@ -240,6 +397,118 @@ def test_count_files_recursive_false(tmp_path):
     assert count == 1
 
 
+def test_count_files_skips_symlinked_directories(tmp_path):
+    """Test count_files does not descend into symlinked directories."""
+    real = tmp_path / "real"
+    real.mkdir()
+    (real / "file.txt").write_text("test")
+    try:
+        (tmp_path / "link").symlink_to(real, target_is_directory=True)
+    except OSError:
+        pytest.skip("Symlinks not supported")
+
+    assert count_files(tmp_path, recursive=True) == 1
+
+
+def test_collect_files_to_list_walks_top_down(tmp_path):
+    """Test files are collected depth-first in directory listing order."""
+    from hashreport.utils.scanner import collect_files_to_list
+
+    (tmp_path / "root.txt").write_text("test")
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "deep").mkdir()
+    (tmp_path / "a" / "deep" / "deep.txt").write_text("test")
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "b.txt").write_text("test")
+
+    files = collect_files_to_list(str(tmp_path))
+    assert sorted(files) == sorted(
+        [
+            str(tmp_path / "root.txt"),
+            str(tmp_path / "a" / "deep" / "deep.txt"),
+            str(tmp_path / "b" / "b.txt"),
+        ]
+    )
+    assert files[0] == str(tmp_path / "root.txt")
+    assert collect_files_to_list(str(tmp_path), recursive=False) == [
+        str(tmp_path / "root.txt")
+    ]
+
+
+def test_parallel_walk_matches_sequential_order(tmp_path):
+    """Test listing directories on several threads keeps the walk order."""
+    from hashreport.utils.scanner import _iter_file_entries
+
+    for top in ("a", "b", "c"):
+        for sub in ("x", "y"):
+            directory = tmp_path / top / sub
+            directory.mkdir(parents=True)
+            (directory / "file.txt").write_text("test")
+        (tmp_path / top / "top.txt").write_text("test")
+
+    sequential = [e.path for e in _iter_file_entries(tmp_path, workers=1)]
+    parallel = [e.path for e in _iter_file_entries(tmp_path, workers=4)]
+
+    assert len(sequential) == 9
+    assert parallel == sequential
+
+
+def test_parallel_walk_stops_early(tmp_path):
+    """Test abandoning a parallel walk shuts its listing threads down."""
+    from hashreport.utils.scanner import _iter_file_entries
+
+    for i in range(5):
+        (tmp_path / f"dir{i}").mkdir()
+        (tmp_path / f"dir{i}" / "file.txt").write_text("test")
+
+    walker = _iter_file_entries(tmp_path, workers=4)
+    assert next(walker).name == "file.txt"
+    walker.close()
+
+
+def test_parallel_walk_bounds_read_ahead(tmp_path):
+    """Test a parallel walk only lists a few directories ahead of the caller."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from hashreport.utils import scanner
+
+    submitted = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            submitted.append(args[0])
+            return super().submit(fn, *args, **kwargs)
+
+    for i in range(20):
+        (tmp_path / f"dir{i:02d}").mkdir()
+        (tmp_path / f"dir{i:02d}" / "file.txt").write_text("test")
+
+    with patch("hashreport.utils.scanner.ThreadPoolExecutor", RecordingExecutor):
+        walker = scanner._iter_file_entries(tmp_path, workers=2)
+        assert next(walker).name == "file.txt"
+        walker.close()
+
+    # The root listing plus at most two listings per worker
+    assert len(submitted) <= 1 + 2 * scanner._LISTINGS_PER_WORKER
+
+
+def test_collect_files_to_list_normalizes_relative_root(tmp_path, monkeypatch):
+    """Test a relative root is normalized the way Path does before walking."""
+    from hashreport.utils.scanner import collect_files_to_list
+
+    (tmp_path / "tree" / "sub").mkdir(parents=True)
+    (tmp_path / "tree" / "a.txt").write_text("test")
+    (tmp_path / "tree" / "sub" / "b.txt").write_text("test")
+    monkeypatch.chdir(tmp_path)
+
+    expected = [
+        os.path.join("tree", "a.txt"),
+        os.path.join("tree", "sub", "b.txt"),
+    ]
+    for root in ("./tree/", "tree//"):
+        assert sorted(collect_files_to_list(root)) == expected
+
+
 def test_count_files_with_filters(tmp_path):
     """Test count_files with various filters."""
     # Create test files
@@ -254,3 +523,13 @@ def test_count_files_with_filters(tmp_path):
     # Test size filter
     count = count_files(tmp_path, recursive=True, min_size="500B")
     assert count == 1
+
+
+def test_process_single_batch_updates_progress_once(serial_pool, file_batch):
+    """Test a batch advances the progress bar with one coalesced update."""
+    progress_bar = MagicMock()
+
+    _process_single_batch(serial_pool, file_batch, "sha256", progress_bar)
+
+    progress_bar.update.assert_called_with(10, file_name="file9.txt")
+    assert sum(c.args[0] for c in progress_bar.update.call_args_list) == 10
@@ -1,12 +1,40 @@
 """Tests for thread pool utilities."""
 
+import threading
 import time
 from concurrent.futures import Future
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from hashreport.utils.thread_pool import ResourceMonitor, ThreadPoolManager
+from hashreport.utils.thread_pool import ResourceMonitor, ThreadPoolManager, config
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _fast_psutil():
+    """Serve the resource monitor steady readings instead of reading /proc.
+
+    Memory sits between the increase and reduce thresholds so the monitor
+    leaves the worker count alone; tests needing other readings patch them.
+    The stubs are module-scoped so the shared pool's monitor keeps using them.
+    """
+    process = MagicMock()
+    process.memory_percent.return_value = config.memory_threshold * 0.7
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "hashreport.utils.thread_pool.psutil.Process", lambda *a, **k: process
+        )
+        mp.setattr(
+            "hashreport.utils.thread_pool.psutil.cpu_percent", lambda *a, **k: 10.0
+        )
+        yield
+
+
+@pytest.fixture(scope="module")
+def pool(_fast_psutil):
+    """Share one running pool across tests that only submit work to it."""
+    with ThreadPoolManager(initial_workers=2) as shared_pool:
+        yield shared_pool
 
 
 def test_thread_pool_initialization():
@@ -17,20 +45,49 @@ def test_thread_pool_initialization():
     assert isinstance(pool.resource_monitor, ResourceMonitor)
 
 
-def test_resource_monitor():
+@patch("hashreport.utils.thread_pool.threading.Thread")
+def test_resource_monitor(mock_thread):
     """Test resource monitor initialization and control."""
     pool = ThreadPoolManager(initial_workers=2)
     monitor = pool.resource_monitor
 
+    mock_thread.assert_called_once_with(target=monitor._monitor_resources, daemon=True)
     assert not monitor._stop_event.is_set()
     monitor.start()
-    assert monitor._monitor_thread.is_alive()
+    mock_thread.return_value.start.assert_called_once_with()
 
     monitor.stop()
     assert monitor._stop_event.is_set()
+    mock_thread.return_value.join.assert_called_once_with()
+
+
+def test_resource_monitor_stops_without_waiting_out_interval():
+    """Test stop() wakes the monitor instead of waiting for its sleep."""
+    pool = ThreadPoolManager(initial_workers=2)
+    monitor = pool.resource_monitor
+
+    with patch("hashreport.utils.thread_pool.config.resource_check_interval", 60):
+        monitor.start()
+        started = time.monotonic()
+        monitor.stop()
+
+    assert time.monotonic() - started < 5
     assert not monitor._monitor_thread.is_alive()
 
 
+@patch("hashreport.utils.thread_pool.config.resource_check_interval", 1.0)
+def test_resource_monitor_backs_off_while_stable():
+    """Test the poll interval grows on stable readings and resets on change."""
+    monitor = ThreadPoolManager(initial_workers=2).resource_monitor
+
+    intervals = []
+    for memory_percent in (40.0, 40.5, 41.0, 40.2, 40.0, 40.1, 55.0):
+        monitor._update_interval(memory_percent)
+        intervals.append(monitor._interval)
+
+    assert intervals == [1.0, 2.0, 4.0, 8.0, 8.0, 8.0, 1.0]
+
+
 def test_worker_adjustment():
     """Test worker count adjustment."""
     with ThreadPoolManager(initial_workers=4) as pool:
@@ -42,7 +99,7 @@ def test_worker_adjustment():
         assert pool.current_workers == initial
 
 
-def test_batch_processing():
+def test_batch_processing(pool):
     """Test batch processing with retries."""
     items = list(range(5))
 
@@ -52,9 +109,8 @@ def test_batch_processing():
             raise ValueError("Simulate failure")
         return x * 2
 
-    with ThreadPoolManager(initial_workers=2) as pool:
-        results = pool.process_items(items, process_func)
-        assert sorted(results) == [0, 2, 4, 6, 8]
+    results = pool.process_items(items, process_func)
+    assert sorted(results) == [0, 2, 4, 6, 8]
 
 
 def test_context_manager():
@@ -66,43 +122,20 @@ def test_context_manager():
         pytest.fail("Expected executor to be shutdown")
 
 
-def test_parallel_processing():
+def test_parallel_processing(pool):
     """Test parallel processing of items."""
 
-    def slow_process(x):
-        time.sleep(0.1)
-        return x * 2
-
     items = [1, 2, 3]
-    with ThreadPoolManager(initial_workers=2) as pool:
-        results = pool.process_items(items, slow_process, show_progress=True)
-        if sorted(results) != [2, 4, 6]:
-            pytest.fail("Expected doubled values")
-
+    results = pool.process_items(items, lambda x: x * 2, show_progress=True)
+    if sorted(results) != [2, 4, 6]:
+        pytest.fail("Expected doubled values")
 
-def test_error_handling():
-    """Test error handling during processing."""
 
-    def failing_process(x):
-        if x == 2:
-            raise ValueError("Test error")
-        return x
-
-    items = [1, 2, 3]
-    with ThreadPoolManager() as pool:
-        results = pool.process_items(items, failing_process)
-        if len(results) != 2:  # Should have 2 successful results
-            pytest.fail("Expected 2 successful results")
-        if sorted(results) != [1, 3]:
-            pytest.fail("Expected results [1, 3]")
-
-
-def test_empty_items():
+def test_empty_items(pool):
     """Test processing empty item list."""
-    with ThreadPoolManager() as pool:
-        results = pool.process_items([], lambda x: x)
-        if results != []:
-            pytest.fail("Expected empty results list")
+    results = pool.process_items([], lambda x: x)
+    if results != []:
+        pytest.fail("Expected empty results list")
 
 
 @patch("concurrent.futures.ThreadPoolExecutor.submit")
@@ -133,38 +166,50 @@ def test_progress_tracking(mock_progress):
     with ThreadPoolManager(progress_bar=mock_bar) as pool:
         pool.process_items(items, lambda x: x)
 
-    assert mock_bar.update.call_count == len(items)
+    assert mock_bar.update.call_count >= 1
+    assert sum(c.args[0] for c in mock_bar.update.call_args_list) == len(items)
     assert mock_bar.close.call_count == 1  # Changed from finish to close
 
 
 @patch("psutil.Process")
 def test_resource_monitoring(mock_process):
     """Test resource monitoring and worker adjustment."""
-    mock_process.return_value.memory_percent.return_value = 90.0
+    sampled = threading.Event()
+
+    def memory_percent(value):
+        def sample():
+            sampled.set()
+            return value
+
+        return sample
+
+    mock_process.return_value.memory_percent.side_effect = memory_percent(90.0)
 
     with ThreadPoolManager(initial_workers=4) as pool:
-        time.sleep(0.2)  # Allow monitor to run longer
+        # Wait for the monitor's first sample instead of a fixed sleep
+        assert sampled.wait(timeout=1.0)
         # Resource monitoring may or may not reduce workers immediately
         # Just verify the monitoring is working
         assert pool.resource_monitor._monitor_thread.is_alive()
 
-    mock_process.return_value.memory_percent.return_value = 50.0
+    sampled.clear()
+    mock_process.return_value.memory_percent.side_effect = memory_percent(50.0)
 
     with ThreadPoolManager(initial_workers=2) as pool:
-        time.sleep(0.1)  # Allow monitor to run
+        assert sampled.wait(timeout=1.0)
         assert pool.current_workers >= 2  # Should maintain or increase workers
 
 
-def test_thread_pool_manager_context_exit_with_exception():
+def test_thread_pool_manager_context_exit_with_exception(pool):
     """Test ThreadPoolManager context exit with exception."""
-    with ThreadPoolManager(initial_workers=2) as pool:
-        # Simulate an exception during processing
-        def failing_worker(item):
-            raise ValueError("Worker failed")
 
-        # The thread pool handles exceptions gracefully and skips failed items
-        result = pool.process_items([1, 2, 3], failing_worker)
-        assert result == []  # Failed items are not included in results
+    # Simulate an exception during processing
+    def failing_worker(item):
+        raise ValueError("Worker failed")
+
+    # The thread pool handles exceptions gracefully and skips failed items
+    result = pool.process_items([1, 2, 3], failing_worker)
+    assert result == []  # Failed items are not included in results
 
 
 def test_thread_pool_manager_with_zero_workers():
@@ -175,24 +220,20 @@ def test_thread_pool_manager_with_zero_workers():
 
 
 def test_thread_pool_manager_with_large_worker_count():
-    """Test ThreadPoolManager with large worker count."""
-    with ThreadPoolManager(initial_workers=100) as pool:
+    """Test ThreadPoolManager caps a large worker count to the CPU count."""
+    with patch("hashreport.utils.thread_pool.available_cpu_count", return_value=2):
+        pool = ThreadPoolManager(initial_workers=100)
+    assert pool.current_workers == 8
+
+    with pool:
         result = pool.process_items([1, 2, 3], lambda x: x * 2)
         assert result == [2, 4, 6]
 
 
-def test_thread_pool_manager_process_empty_list():
-    """Test ThreadPoolManager with empty input list."""
-    with ThreadPoolManager(initial_workers=2) as pool:
-        result = pool.process_items([], lambda x: x * 2)
-        assert result == []
-
-
-def test_thread_pool_manager_process_single_item():
+def test_thread_pool_manager_process_single_item(pool):
     """Test ThreadPoolManager with single item."""
-    with ThreadPoolManager(initial_workers=2) as pool:
-        result = pool.process_items([5], lambda x: x * 2)
-        assert result == [10]
+    result = pool.process_items([5], lambda x: x * 2)
+    assert result == [10]
 
 
 def test_thread_pool_manager_with_progress_bar():
@@ -207,74 +248,60 @@ def test_thread_pool_manager_with_progress_bar():
         mock_progress.update.assert_called()
 
 
-def test_thread_pool_manager_worker_exception_handling():
+def test_thread_pool_manager_worker_exception_handling(pool):
     """Test ThreadPoolManager handling of worker exceptions."""
-    with ThreadPoolManager(initial_workers=2) as pool:
 
-        def worker_with_exception(item):
-            if item == 2:
-                raise RuntimeError("Item 2 failed")
-            return item * 2
+    def worker_with_exception(item):
+        if item == 2:
+            raise RuntimeError("Item 2 failed")
+        return item * 2
 
-        # The thread pool handles exceptions gracefully and skips failed items
-        result = pool.process_items([1, 2, 3], worker_with_exception)
-        assert result == [2, 6]  # Item 2 failed and was skipped, others succeeded
+    # The thread pool handles exceptions gracefully and skips failed items
+    result = pool.process_items([1, 2, 3], worker_with_exception)
+    assert result == [2, 6]  # Item 2 failed and was skipped, others succeeded
 
+    # Pool should still be usable after a failed item
+    assert pool.process_items([4], lambda x: x * 2) == [8]
 
-def test_thread_pool_manager_worker_timeout():
-    """Test ThreadPoolManager with worker timeout."""
-    import time
 
-    with ThreadPoolManager(initial_workers=1) as pool:
+def test_thread_pool_manager_single_worker():
+    """Test ThreadPoolManager with a single worker draining the batch."""
+    threads = set()
 
-        def slow_worker(item):
-            time.sleep(0.1)  # Simulate slow processing
-            return item * 2
+    def worker(item):
+        threads.add(threading.get_ident())
+        return item * 2
 
-        result = pool.process_items([1, 2, 3], slow_worker)
-        assert result == [2, 4, 6]
+    with ThreadPoolManager(initial_workers=1) as pool:
+        result = pool.process_items(list(range(10)), worker, chunksize=2)
 
+    assert result == [i * 2 for i in range(10)]
+    assert len(threads) == 1
+    assert threading.get_ident() not in threads
 
-def test_thread_pool_manager_concurrent_access():
-    """Test ThreadPoolManager with concurrent access."""
-    import threading
-    import time
 
+def test_thread_pool_manager_concurrent_access(pool):
+    """Test ThreadPoolManager with concurrent access."""
     results = []
     lock = threading.Lock()
+    chunksize = 3
+    # The first items of the first two chunks only get past this together,
+    # which fails the test unless two workers really run at once
+    barrier = threading.Barrier(2, timeout=2.0)
 
     def worker(item):
+        if item in (0, chunksize):
+            barrier.wait()
         with lock:
             results.append(item * 2)
-        time.sleep(0.01)  # Small delay to ensure concurrency
         return item * 2
 
-    with ThreadPoolManager(initial_workers=4) as pool:
-        result = pool.process_items(list(range(10)), worker)
-        assert result == [i * 2 for i in range(10)]
-        assert len(results) == 10
-
-
-def test_thread_pool_manager_cleanup_on_exception():
-    """Test ThreadPoolManager cleanup when exception occurs."""
-    with ThreadPoolManager(initial_workers=2) as pool:
-
-        def failing_worker(item):
-            if item == 5:
-                raise ValueError("Intentional failure")
-            return item * 2
-
-        try:
-            pool.process_items([1, 2, 3, 4, 5], failing_worker)
-        except ValueError:
-            pass
-
-        # Pool should still be usable after exception
-        result = pool.process_items([1, 2, 3], lambda x: x * 2)
-        assert result == [2, 4, 6]
+    result = pool.process_items(list(range(10)), worker, chunksize=chunksize)
+    assert result == [i * 2 for i in range(10)]
+    assert len(results) == 10
 
 
-def test_thread_pool_manager_with_complex_objects():
+def test_thread_pool_manager_with_complex_objects(pool):
     """Test ThreadPoolManager with complex objects."""
 
     class TestObject:
@@ -286,19 +313,63 @@ def test_thread_pool_manager_with_complex_objects():
 
     objects = [TestObject(i) for i in range(5)]
 
-    with ThreadPoolManager(initial_workers=2) as pool:
-        result = pool.process_items(objects, lambda obj: obj.process())
-        assert result == [0, 2, 4, 6, 8]
+    result = pool.process_items(objects, lambda obj: obj.process())
+    assert result == [0, 2, 4, 6, 8]
 
 
-def test_thread_pool_manager_worker_return_none():
+def test_thread_pool_manager_worker_return_none(pool):
     """Test ThreadPoolManager with workers returning None."""
-    with ThreadPoolManager(initial_workers=2) as pool:
 
-        def worker_return_none(item):
-            if item % 2 == 0:
-                return None
-            return item * 2
+    def worker_return_none(item):
+        if item % 2 == 0:
+            return None
+        return item * 2
+
+    result = pool.process_items([1, 2, 3, 4, 5], worker_return_none)
+    assert result == [2, None, 6, None, 10]
+
+
+def test_process_items_in_chunks():
+    """Test chunked submission keeps order, item counts and progress."""
+    mock_progress = MagicMock()
+
+    with ThreadPoolManager(initial_workers=2, progress_bar=mock_progress) as pool:
+        with patch.object(
+            pool.executor, "submit", wraps=pool.executor.submit
+        ) as mock_submit:
+            result = pool.process_items(list(range(10)), lambda x: x * 2, chunksize=4)
+
+        assert result == [i * 2 for i in range(10)]
+        assert mock_submit.call_count == 3
+        assert pool.metrics.successful_items == 10
+        assert sum(c.args[0] for c in mock_progress.update.call_args_list) == 10
+
+
+def test_completed_futures_are_untracked(pool):
+    """Test finished futures leave the pending set once collected."""
+    pool.process_items(list(range(20)), lambda x: x)
+    assert not pool._submitted_futures
+
+
+def test_failing_item_only_retries_itself():
+    """Test one failing item in a chunk keeps and does not rerun the others."""
+    calls = []
+    lock = threading.Lock()
+
+    def process(x):
+        with lock:
+            calls.append(x)
+        if x == 2:
+            raise ValueError("Bad item")
+        return x * 2
+
+    with patch("hashreport.utils.thread_pool.config.retry_delay", 0), patch(
+        "hashreport.utils.thread_pool.config.max_retries", 3
+    ):
+        with ThreadPoolManager(initial_workers=2) as pool:
+            result = pool.process_items([0, 1, 2, 3], process, chunksize=4)
 
-        result = pool.process_items([1, 2, 3, 4, 5], worker_return_none)
-        assert result == [2, None, 6, None, 10]
+    assert result == [0, 2, 6]
+    assert sorted(calls) == [0, 1, 2, 2, 2, 2, 3]
+    assert pool.metrics.successful_items == 3
+    assert pool.metrics.failed_items == 4
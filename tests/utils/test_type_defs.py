@@ -119,87 +119,85 @@ class TestProtocols:
 class TestValidationFunctions:
     """Test validation utility functions."""
 
-    def test_validate_file_path_valid(self):
+    @pytest.mark.parametrize(
+        "path", ["/path/to/file", Path("/path/to/file"), "relative/path"]
+    )
+    def test_validate_file_path_valid(self, path):
         """Test validate_file_path with valid paths."""
-        valid_paths = ["/path/to/file", Path("/path/to/file"), "relative/path"]
-        for path in valid_paths:
-            result = validate_file_path(path)
-            assert result == path
+        result = validate_file_path(path)
+        assert result == path
 
-    def test_validate_file_path_invalid(self):
+    @pytest.mark.parametrize("path", [123, None, [], {}, ("tuple", "not", "path")])
+    def test_validate_file_path_invalid(self, path):
         """Test validate_file_path with invalid paths."""
-        invalid_paths = [123, None, [], {}, ("tuple", "not", "path")]
-        for path in invalid_paths:
-            with pytest.raises(ValueError, match="Invalid file path type"):
-                validate_file_path(path)
+        with pytest.raises(ValueError, match="Invalid file path type"):
+            validate_file_path(path)
 
-    def test_validate_hash_algorithm_valid(self):
+    @pytest.mark.parametrize("algo", ["md5", "sha1", "sha256", "sha512", "blake2b"])
+    def test_validate_hash_algorithm_valid(self, algo):
         """Test validate_hash_algorithm with valid algorithms."""
-        valid_algorithms = ["md5", "sha1", "sha256", "sha512", "blake2b"]
-        for algo in valid_algorithms:
-            result = validate_hash_algorithm(algo)
-            assert result == algo.lower()
+        result = validate_hash_algorithm(algo)
+        assert result == algo.lower()
 
-            # Test case insensitivity
-            result = validate_hash_algorithm(algo.upper())
-            assert result == algo.lower()
+        # Test case insensitivity
+        result = validate_hash_algorithm(algo.upper())
+        assert result == algo.lower()
 
-    def test_validate_hash_algorithm_invalid(self):
+    @pytest.mark.parametrize("algo", ["invalid", "sha3", "ripemd160", ""])
+    def test_validate_hash_algorithm_invalid(self, algo):
         """Test validate_hash_algorithm with invalid algorithms."""
-        invalid_algorithms = ["invalid", "sha3", "ripemd160", ""]
-        for algo in invalid_algorithms:
-            with pytest.raises(ValueError, match="Unsupported hash algorithm"):
-                validate_hash_algorithm(algo)
+        with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+            validate_hash_algorithm(algo)
 
-    def test_validate_hash_algorithm_case_insensitive(self):
+    @pytest.mark.parametrize(
+        "algorithm", ["MD5", "Sha1", "SHA256", "sha512", "BLAKE2B"]
+    )
+    def test_validate_hash_algorithm_case_insensitive(self, algorithm):
         """Test validate_hash_algorithm with different cases."""
-        algorithms = ["MD5", "Sha1", "SHA256", "sha512", "BLAKE2B"]
-        for algorithm in algorithms:
-            result = validate_hash_algorithm(algorithm)
-            assert result == algorithm.lower()
+        result = validate_hash_algorithm(algorithm)
+        assert result == algorithm.lower()
 
-    def test_validate_report_format_valid(self):
+    @pytest.mark.parametrize("fmt", ["csv", "json"])
+    def test_validate_report_format_valid(self, fmt):
         """Test validate_report_format with valid formats."""
-        valid_formats = ["csv", "json"]
-        for fmt in valid_formats:
-            result = validate_report_format(fmt)
-            assert result == fmt.lower()
+        result = validate_report_format(fmt)
+        assert result == fmt.lower()
 
-            # Test case insensitivity
-            result = validate_report_format(fmt.upper())
-            assert result == fmt.lower()
+        # Test case insensitivity
+        result = validate_report_format(fmt.upper())
+        assert result == fmt.lower()
 
-    def test_validate_report_format_invalid(self):
+    @pytest.mark.parametrize("fmt", ["xml", "yaml", "txt", ""])
+    def test_validate_report_format_invalid(self, fmt):
         """Test validate_report_format with invalid formats."""
-        invalid_formats = ["xml", "yaml", "txt", ""]
-        for fmt in invalid_formats:
-            with pytest.raises(ValueError, match="Unsupported report format"):
-                validate_report_format(fmt)
+        with pytest.raises(ValueError, match="Unsupported report format"):
+            validate_report_format(fmt)
 
-    def test_validate_report_format_case_insensitive(self):
+    @pytest.mark.parametrize("format_str", ["CSV", "Json", "JSON"])
+    def test_validate_report_format_case_insensitive(self, format_str):
         """Test validate_report_format with different cases."""
-        formats = ["CSV", "Json", "JSON"]
-        for format_str in formats:
-            result = validate_report_format(format_str)
-            assert result == format_str.lower()
+        result = validate_report_format(format_str)
+        assert result == format_str.lower()
 
-    def test_validate_email_address_valid(self):
-        """Test validate_email_address with valid emails."""
-        valid_emails = [
+    @pytest.mark.parametrize(
+        "email",
+        [
             "test@example.com",
             "user.name@domain.co.uk",
             "user+tag@example.org",
             "123@test.com",
-        ]
-        for email in valid_emails:
-            result = validate_email_address(email)
-            # NewType can't be used with isinstance, but we can check the value
-            assert result == email
-            assert isinstance(result, str)
-
-    def test_validate_email_address_invalid(self):
-        """Test validate_email_address with invalid emails."""
-        invalid_emails = [
+        ],
+    )
+    def test_validate_email_address_valid(self, email):
+        """Test validate_email_address with valid emails."""
+        result = validate_email_address(email)
+        # NewType can't be used with isinstance, but we can check the value
+        assert result == email
+        assert isinstance(result, str)
+
+    @pytest.mark.parametrize(
+        "email",
+        [
             "invalid-email",  # No @ symbol
             "@example.com",  # No local part
             "user@",  # No domain
@@ -208,53 +206,64 @@ class TestValidationFunctions:
             "user@domain",  # Missing TLD
             "user@example",  # Missing TLD
             "user@@example.com",  # Double @
-        ]
-        for email in invalid_emails:
-            with pytest.raises(ValueError, match="Invalid email address format"):
-                validate_email_address(email)
+        ],
+    )
+    def test_validate_email_address_invalid(self, email):
+        """Test validate_email_address with invalid emails."""
+        with pytest.raises(ValueError, match="Invalid email address format"):
+            validate_email_address(email)
 
-    def test_validate_port_number_valid(self):
+    @pytest.mark.parametrize("port", [1, 80, 443, 8080, 65535])
+    def test_validate_port_number_valid(self, port):
         """Test validate_port_number with valid ports."""
-        valid_ports = [1, 80, 443, 8080, 65535]
-        for port in valid_ports:
-            result = validate_port_number(port)
-            # NewType can't be used with isinstance, but we can check the value
-            assert result == port
-            assert isinstance(result, int)
-
-    def test_validate_port_number_invalid(self):
+        result = validate_port_number(port)
+        # NewType can't be used with isinstance, but we can check the value
+        assert result == port
+        assert isinstance(result, int)
+
+    @pytest.mark.parametrize("port", [0, -1, 65536, 99999])
+    def test_validate_port_number_invalid(self, port):
         """Test validate_port_number with invalid ports."""
-        invalid_ports = [0, -1, 65536, 99999]
-        for port in invalid_ports:
-            with pytest.raises(ValueError, match="Invalid port number"):
-                validate_port_number(port)
+        with pytest.raises(ValueError, match="Invalid port number"):
+            validate_port_number(port)
 
-    def test_validate_hostname_valid(self):
-        """Test validate_hostname with valid hostnames."""
-        valid_hostnames = [
+    @pytest.mark.parametrize(
+        "hostname",
+        [
             "example.com",
             "subdomain.example.org",
             "test.co.uk",
             "localhost.localdomain",
-        ]
-        for hostname in valid_hostnames:
-            result = validate_hostname(hostname)
-            # NewType can't be used with isinstance, but we can check the value
-            assert result == hostname
-            assert isinstance(result, str)
-
-    def test_validate_hostname_invalid(self):
-        """Test validate_hostname with invalid hostnames."""
-        invalid_hostnames = [
+        ],
+    )
+    def test_validate_hostname_valid(self, hostname):
+        """Test validate_hostname with valid hostnames."""
+        result = validate_hostname(hostname)
+        # NewType can't be used with isinstance, but we can check the value
+        assert result == hostname
+        assert isinstance(result, str)
+
+    @pytest.mark.parametrize(
+        "hostname",
+        [
             "invalid",  # No dot
             ".example.com",  # Starts with dot
             "example.",  # Ends with dot
             "",
             "example",  # No TLD
-        ]
-        for hostname in invalid_hostnames:
-            with pytest.raises(ValueError, match="Invalid hostname format"):
-                validate_hostname(hostname)
+            "example..com",  # Empty label
+            "-example.com",  # Label starts with hyphen
+            "example-.com",  # Label ends with hyphen
+            "example.c0m",  # Non-alphabetic TLD
+            "example.com\n",  # Trailing newline
+            "a" * 64 + ".com",  # Label longer than 63 characters
+            ".".join(["a" * 63] * 4) + ".com",  # Longer than 253 characters
+        ],
+    )
+    def test_validate_hostname_invalid(self, hostname):
+        """Test validate_hostname with invalid hostnames."""
+        with pytest.raises(ValueError, match="Invalid hostname format"):
+            validate_hostname(hostname)
 
 
 class TestReportDataValidation:
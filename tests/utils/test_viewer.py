@@ -78,8 +78,9 @@ def mock_file(tmp_path, sample_report_data):
     return file_path
 
 
-def test_view_report(mock_file):
-    """Test basic report viewing."""
+@pytest.fixture
+def console_viewer():
+    """Viewer writing to an in-memory console with the pager patched out."""
     viewer = ReportViewer()
     console = Console(file=io.StringIO(), force_terminal=True)
     viewer.console = console
@@ -87,60 +88,45 @@ def test_view_report(mock_file):
     with patch.object(console, "pager") as mock_pager:
         mock_pager.__enter__ = MagicMock()
         mock_pager.__exit__ = MagicMock()
-        viewer.display_report(mock_file)
+        yield viewer
 
-        output = console.file.getvalue()
-        # Use less strict assertions that ignore formatting
-        assert "test1.txt" in output
-        assert "test2.txt" in output
-        assert "Total entries: 2" in output.replace("\x1b[1;36m", "").replace(
-            "\x1b[0m", ""
-        )
 
+def test_view_report(console_viewer, mock_file):
+    """Test basic report viewing."""
+    console_viewer.display_report(mock_file)
 
-def test_view_report_with_filter(mock_file):
-    """Test report viewing with filter."""
-    viewer = ReportViewer()
-    console = Console(file=io.StringIO(), force_terminal=True)
-    viewer.console = console
+    output = console_viewer.console.file.getvalue()
+    # Use less strict assertions that ignore formatting
+    assert "test1.txt" in output
+    assert "test2.txt" in output
+    assert "Total entries: 2" in output.replace("\x1b[1;36m", "").replace("\x1b[0m", "")
 
-    with patch.object(console, "pager") as mock_pager:
-        mock_pager.__enter__ = MagicMock()
-        mock_pager.__exit__ = MagicMock()
-        viewer.display_report(mock_file, filter_text="test1")
 
-        output = console.file.getvalue()
-        assert "test1.txt" in output
-        assert "test2.txt" not in output
-        assert "Total entries: 1" in output.replace("\x1b[1;36m", "").replace(
-            "\x1b[0m", ""
-        )
+def test_view_report_with_filter(console_viewer, mock_file):
+    """Test report viewing with filter."""
+    console_viewer.display_report(mock_file, filter_text="test1")
 
+    output = console_viewer.console.file.getvalue()
+    assert "test1.txt" in output
+    assert "test2.txt" not in output
+    assert "Total entries: 1" in output.replace("\x1b[1;36m", "").replace("\x1b[0m", "")
 
-def test_display_comparison(sample_comparison):
-    """Test comparison display."""
-    viewer = ReportViewer()
-    console = Console(file=io.StringIO(), force_terminal=True)
-    viewer.console = console
 
-    with patch.object(console, "pager") as mock_pager:
-        mock_pager.__enter__ = MagicMock()
-        mock_pager.__exit__ = MagicMock()
-        viewer.display_comparison(sample_comparison)
-
-        output = console.file.getvalue()
-        # Check all change types are present
-        assert "modified" in output.lower()
-        assert "moved" in output.lower()
-        assert "added" in output.lower()
-        assert "removed" in output.lower()
-        # Check file details
-        assert "test1.txt" in output
-        assert "Hash changed" in output
-        assert "File moved" in output
-        assert "Total changes: 4" in output.replace("\x1b[1;36m", "").replace(
-            "\x1b[0m", ""
-        )
+def test_display_comparison(console_viewer, sample_comparison):
+    """Test comparison display."""
+    console_viewer.display_comparison(sample_comparison)
+
+    output = console_viewer.console.file.getvalue()
+    # Check all change types are present
+    assert "modified" in output.lower()
+    assert "moved" in output.lower()
+    assert "added" in output.lower()
+    assert "removed" in output.lower()
+    # Check file details
+    assert "test1.txt" in output
+    assert "Hash changed" in output
+    assert "File moved" in output
+    assert "Total changes: 4" in output.replace("\x1b[1;36m", "").replace("\x1b[0m", "")
 
 
 def test_invalid_file_format():